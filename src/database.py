@@ -5,7 +5,8 @@ import csv
 import json
 import sqlite3
 import datetime
-from typing import Any, Dict, Iterable, List, Optional
+import functools
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -20,6 +21,60 @@ def _env_flag(name: str, default: bool = False) -> bool:
 APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_DB_PATH = os.path.join(APP_DIR, "data", "reseller.db")
 
+# Size of sqlite3's per-connection prepared statement cache.  The expenses and
+# inventory tabs re-run the same handful of queries on every refresh, so a
+# generous cache means each statement is only compiled once per connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Frequently executed queries are kept as module-level constants so the exact
+# same SQL text is handed to sqlite3 on every call, which lets its statement
+# cache reuse the prepared statement instead of re-parsing the query.
+SQL_GET_EXPENSES = "SELECT * FROM expenses ORDER BY date DESC, id DESC"
+SQL_GET_EXPENSE = "SELECT * FROM expenses WHERE id=?"
+SQL_GET_EXPENSE_INVENTORY_COUNT = (
+    "SELECT COUNT(*) AS count FROM expense_inventory WHERE expense_id=?"
+)
+SQL_COUNT_INVENTORY_ITEMS = "SELECT COUNT(*) FROM inventory"
+SQL_COUNT_EXPENSES = "SELECT COUNT(*) FROM expenses"
+SQL_GET_INVENTORY_PRICING_ROWS = """
+    SELECT
+        id,
+        title,
+        COALESCE(NULLIF(NULLIF(cost, ''), 0),
+                 NULLIF(NULLIF(purchase_price, ''), 0), 0) AS cost,
+        weight_lbs,
+        length_in,
+        width_in,
+        height_in
+    FROM inventory
+    WHERE LOWER(status)=LOWER(?)
+    ORDER BY id DESC
+"""
+SQL_GET_INVENTORY_STATS = """
+    SELECT
+        COUNT(*) AS total,
+        SUM(CASE WHEN LOWER(status)='in stock' THEN 1 ELSE 0 END) AS in_stock,
+        SUM(CASE WHEN LOWER(status)='listed' THEN 1 ELSE 0 END) AS listed,
+        SUM(CASE WHEN LOWER(status)='sold' THEN 1 ELSE 0 END) AS sold,
+        SUM(CASE WHEN LOWER(status)='in stock' THEN COALESCE(
+            CASE WHEN typeof(cost) IN ('integer', 'real') THEN cost END,
+            CASE WHEN typeof(purchase_price) IN ('integer', 'real')
+                THEN purchase_price END
+        ) END) AS in_stock_value
+    FROM inventory
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _split_mapping_columns(spec: str) -> Tuple[str, ...]:
+    """Split a ``Title|Item Title`` style mapping value into column names.
+
+    Mapping values are reused for every row of an import, so the parsed form
+    is memoised instead of re-splitting the same string per row.
+    """
+
+    return tuple(part.strip() for part in spec.split("|") if part.strip())
+
 
 class Database:
     """SQLite data layer for the eBay Reseller Manager app."""
@@ -42,11 +97,19 @@ class Database:
         "order_number": "order_number",
     }
 
-    def __init__(self, db_path: str = DEFAULT_DB_PATH, *, feature_flags: Optional[Dict[str, bool]] = None):
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        *,
+        feature_flags: Optional[Dict[str, bool]] = None,
+        create_schema: bool = True,
+    ):
         """Initialize database connection and create tables if needed.
         
         Args:
             db_path: Path to SQLite database file. Uses default path if not specified.
+            create_schema: Create/migrate tables on connect.  Secondary
+                connections to an already initialised file pass ``False``.
         """
         try:
             directory = os.path.dirname(db_path)
@@ -58,9 +121,21 @@ class Database:
             # in-memory databases or relative file paths.
             if directory:
                 os.makedirs(directory, exist_ok=True)
-            self.conn = sqlite3.connect(db_path)
+            self.db_path = db_path
+            self.conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
             self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
+            # Only the owning connection switches the file to WAL and
+            # checkpoints it on close(); open_reader() connections don't.
+            self._owns_wal = create_schema and not self.is_in_memory
+            if self._owns_wal:
+                # Connections from open_reader() query on worker threads; in
+                # WAL mode they can read while this connection writes.  The
+                # mode is stored in the file and persists after closing;
+                # while the database is open, committed data may still sit
+                # in the -wal file beside it, so copy all three files (or
+                # close the app first; close() checkpoints the log away).
+                self.conn.execute("PRAGMA journal_mode=WAL")
             self.feature_flags: Dict[str, bool] = dict(feature_flags or {})
             if "enable_min_inventory_orders" not in self.feature_flags:
                 self.feature_flags["enable_min_inventory_orders"] = _env_flag(
@@ -69,11 +144,43 @@ class Database:
             self.enable_min_inventory_orders = bool(
                 self.feature_flags.get("enable_min_inventory_orders", False)
             )
-            self.create_tables()
+            # Parsed import mappings keyed by report type.  ``update_mapping``
+            # is the only writer, so entries stay valid for the connection's
+            # lifetime and repeated imports skip the SELECT + JSON decode.
+            self._mapping_cache: Dict[str, Dict[str, str]] = {}
+            if create_schema:
+                self.create_tables()
         except Exception as e:
             self.log_error("Database initialization failed", str(e))
             raise
 
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever this connection modifies a row.
+
+        sqlite3 tracks the number of rows inserted, updated or deleted since
+        the connection was opened, which makes a cheap invalidation token for
+        caches derived from the database.
+        """
+        return self.conn.total_changes
+
+    def open_reader(self) -> Optional["Database"]:
+        """Open a second connection to the same database file.
+
+        sqlite3 connections may only be used from the thread that created
+        them, so background loaders call this on their own thread.  Returns
+        ``None`` for in-memory databases, which cannot be shared.
+        """
+        if self.is_in_memory:
+            return None
+        return Database(self.db_path, feature_flags=self.feature_flags, create_schema=False)
+
+    @property
+    def is_in_memory(self) -> bool:
+        """``True`` when the database only exists inside this connection."""
+        path = str(self.db_path)
+        return path in ("", ":memory:") or path.startswith("file::memory:")
+
     @staticmethod
     def _coerce_float(value: Any) -> Optional[float]:
         """Return ``value`` as ``float`` when possible.
@@ -112,7 +219,11 @@ class Database:
             except TypeError:
                 keys_fn = getattr(row, "keys", lambda: [])
                 data = {key: row[key] for key in keys_fn()}
+        return self._add_cost_aliases(data)
 
+    @staticmethod
+    def _add_cost_aliases(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in ``purchase_cost``/``cost``/``purchase_price`` on ``data``."""
         # Normalise cost aliases for backwards compatibility.
         if "purchase_cost" not in data:
             for alias in ("cost", "purchase_price"):
@@ -131,9 +242,32 @@ class Database:
         return data
 
     def _rows_to_dicts(self, rows: List[Any]) -> List[Dict[str, Any]]:
-        """Convert an iterable of rows into dictionaries."""
+        """Convert an iterable of rows into dictionaries.
+
+        For ``sqlite3.Row`` results the column names are read once for the
+        whole result set and zipped with each row's values, rather than
+        looking every key up again per row.
+        """
+        rows = list(rows)
+        if rows and all(isinstance(row, sqlite3.Row) for row in rows):
+            columns = rows[0].keys()
+            add_aliases = self._add_cost_aliases
+            return [add_aliases(dict(zip(columns, row))) for row in rows]
         return [r for r in (self._row_to_dict(row) for row in rows) if r is not None]
 
+    def _iter_dicts(self, sql: str, params: Iterable[Any] = ()) -> Iterator[Dict[str, Any]]:
+        """Yield the result rows of ``sql`` one dictionary at a time.
+
+        A private cursor is used so other queries may run while the caller
+        is still consuming the rows.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(sql, tuple(params))
+        columns = [d[0] for d in cursor.description]
+        add_aliases = self._add_cost_aliases
+        for row in cursor:
+            yield add_aliases(dict(zip(columns, row)))
+
     # ---------------------------- schema ----------------------------
     def create_tables(self):
         """Create all necessary tables."""
@@ -349,6 +483,7 @@ class Database:
         mapping: Optional[Dict[str, str]],
         field: str,
         fallbacks: List[str],
+        key_map: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
         """Return the value for ``field`` using the user-defined mapping.
 
@@ -356,24 +491,27 @@ class Database:
         by the ``|`` character.  We also try a curated list of sensible
         defaults so that freshly exported eBay reports work even before the
         user customises the mapping.  Column matching is case-insensitive.
+
+        ``key_map`` is an optional precomputed ``{lowercase: header}`` lookup;
+        CSV rows share one header set, so importers build it once per file.
         """
 
         candidates: List[str] = []
         if mapping and mapping.get(field):
-            candidates.extend(part.strip() for part in mapping[field].split("|") if part.strip())
+            candidates.extend(_split_mapping_columns(mapping[field]))
         candidates.extend([c for c in fallbacks if c])
 
         if not candidates:
             return None
 
-        # Filter out None/empty keys before calling .lower()
-        lower_key_map = {k.lower(): k for k in row.keys() if k}
+        if key_map is None:
+            key_map = self._lower_key_map(row.keys())
 
         for column in candidates:
             if not column:  # Skip None/empty candidates
                 continue
             lookup = column.lower()
-            actual_key = column if column in row else lower_key_map.get(lookup)
+            actual_key = column if column in row else key_map.get(lookup)
             if not actual_key:
                 continue
             value = row.get(actual_key)
@@ -381,6 +519,13 @@ class Database:
                 return value
         return None
 
+    @staticmethod
+    def _lower_key_map(keys: Iterable[Optional[str]]) -> Dict[str, str]:
+        """Return a case-insensitive lookup of ``keys``."""
+
+        # Filter out None/empty keys before calling .lower()
+        return {k.lower(): k for k in keys if k}
+
     def _read_csv_rows(self, filepath: str) -> tuple[List[str], List[Dict[str, Any]]]:
         with open(filepath, "r", encoding="utf-8-sig", newline="") as handle:
             filtered = (line for line in handle if line.strip())
@@ -399,9 +544,12 @@ class Database:
         return "active_listings"
 
     def _normalize_active_listing(
-        self, row: Dict[str, Any], mapping: Optional[Dict[str, str]]
+        self,
+        row: Dict[str, Any],
+        mapping: Optional[Dict[str, str]],
+        key_map: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        title = self._resolve_mapped_value(row, mapping, "title", ["Title"])
+        title = self._resolve_mapped_value(row, mapping, "title", ["Title"], key_map)
         if not title:
             raise ValueError("Missing title column in active listings row")
 
@@ -410,36 +558,42 @@ class Database:
             mapping,
             "sku",
             ["Custom label (SKU)", "Custom Label", "SKU"],
+            key_map,
         )
         listed_price_raw = self._resolve_mapped_value(
             row,
             mapping,
             "listed_price",
             ["Current price", "Start price", "Price"],
+            key_map,
         )
         quantity_raw = self._resolve_mapped_value(
             row,
             mapping,
             "quantity",
             ["Available quantity", "Quantity"],
+            key_map,
         )
         listed_date_raw = self._resolve_mapped_value(
             row,
             mapping,
             "listed_date",
             ["Start date", "Start Date"],
+            key_map,
         )
         item_number = self._resolve_mapped_value(
             row,
             mapping,
             "item_number",
             ["Item Number", "Item number"],
+            key_map,
         )
         category = self._resolve_mapped_value(
             row,
             mapping,
             "category_id",
             ["eBay category 1 number", "Category ID"],
+            key_map,
         )
 
         data: Dict[str, Any] = {
@@ -459,13 +613,17 @@ class Database:
         return data
 
     def _normalize_order(
-        self, row: Dict[str, Any], mapping: Optional[Dict[str, str]]
+        self,
+        row: Dict[str, Any],
+        mapping: Optional[Dict[str, str]],
+        key_map: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         order_number = self._resolve_mapped_value(
             row,
             mapping,
             "order_number",
             ["Order Number"],
+            key_map,
         )
         if not order_number:
             raise ValueError("Missing order number in orders row")
@@ -475,36 +633,42 @@ class Database:
             mapping,
             "title",
             ["Item Title", "Title"],
+            key_map,
         )
         sku = self._resolve_mapped_value(
             row,
             mapping,
             "sku",
             ["Custom Label", "Custom label (SKU)", "SKU"],
+            key_map,
         )
         sold_price_raw = self._resolve_mapped_value(
             row,
             mapping,
             "sold_price",
             ["Sold For", "Price", "Sale price"],
+            key_map,
         )
         sold_date_raw = self._resolve_mapped_value(
             row,
             mapping,
             "sold_date",
             ["Paid On Date", "Sale Date", "Sold Date"],
+            key_map,
         )
         quantity_raw = self._resolve_mapped_value(
             row,
             mapping,
             "quantity",
             ["Quantity"],
+            key_map,
         )
         item_number = self._resolve_mapped_value(
             row,
             mapping,
             "item_number",
             ["Item Number"],
+            key_map,
         )
 
         data: Dict[str, Any] = {
@@ -542,9 +706,10 @@ class Database:
             self._normalize_order if detected_type == "orders" else self._normalize_active_listing
         )
 
+        key_map = self._lower_key_map(headers)
         for index, row in enumerate(rows, start=2):
             try:
-                normalized_row = normalizer(row, mapping)
+                normalized_row = normalizer(row, mapping, key_map)
                 if normalized_row:
                     normalized.append(normalized_row)
             except Exception as exc:
@@ -647,22 +812,59 @@ class Database:
             VALUES (?, ?)
             ON CONFLICT(report_type) DO UPDATE SET mapping_json=excluded.mapping_json
             """,
-            (report_type.lower(), json.dumps(cleaned)),
+            (report_type.lower(), json.dumps(cleaned, separators=(",", ":"))),
         )
         self.conn.commit()
+        self._mapping_cache[report_type.lower()] = cleaned
 
     def get_mapping(self, report_type: str) -> Dict[str, str]:
         if not report_type:
             return {}
-        self.cursor.execute(
-            "SELECT mapping_json FROM import_mappings WHERE report_type=?",
-            (report_type.lower(),),
-        )
-        row = self.cursor.fetchone()
-        if not row or not row["mapping_json"]:
+        key = report_type.lower()
+        cached = self._mapping_cache.get(key)
+        if cached is None:
+            self.cursor.execute(
+                "SELECT mapping_json FROM import_mappings WHERE report_type=?",
+                (key,),
+            )
+            row = self.cursor.fetchone()
+            cached = self._decode_mapping(row["mapping_json"] if row else None)
+            self._mapping_cache[key] = cached
+        # Hand out a copy so callers cannot mutate the cached mapping.
+        return dict(cached)
+
+    def get_mappings(self, report_types: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """Return the mappings for several report types with one query.
+
+        Report types without a stored mapping map to an empty dict.  Results
+        are added to the same cache used by :meth:`get_mapping`.
+        """
+
+        keys = list(dict.fromkeys(rt.lower() for rt in report_types if rt))
+        missing = [key for key in keys if key not in self._mapping_cache]
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            self.cursor.execute(
+                "SELECT report_type, mapping_json FROM import_mappings "
+                f"WHERE report_type IN ({placeholders})",
+                missing,
+            )
+            found = {
+                row["report_type"]: self._decode_mapping(row["mapping_json"])
+                for row in self.cursor.fetchall()
+            }
+            for key in missing:
+                self._mapping_cache[key] = found.get(key, {})
+        return {key: dict(self._mapping_cache[key]) for key in keys}
+
+    @staticmethod
+    def _decode_mapping(payload: Optional[str]) -> Dict[str, str]:
+        """Return the stored mapping JSON as a dict (empty when invalid)."""
+
+        if not payload:
             return {}
         try:
-            data = json.loads(row["mapping_json"])
+            data = json.loads(payload)
             if isinstance(data, dict):
                 return data
         except json.JSONDecodeError:
@@ -688,17 +890,67 @@ class Database:
             clauses.append("(LOWER(title) LIKE ? OR LOWER(sku) LIKE ?)")
             params += [q, q]
         where = " WHERE " + " AND ".join(clauses) if clauses else ""
-        self.cursor.execute(f"SELECT * FROM inventory{where} ORDER BY id DESC", params)
+        # Optional paging; ``LIMIT -1`` lets callers pass only an offset.
+        limit = kwargs.get("limit")
+        offset = kwargs.get("offset")
+        page = ""
+        if limit is not None or offset:
+            page = " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else int(limit), int(offset or 0)]
+        self.cursor.execute(f"SELECT * FROM inventory{where} ORDER BY id DESC{page}", params)
         return self._rows_to_dicts(self.cursor.fetchall())
 
+    def iter_inventory_items(self) -> Iterator[Dict[str, Any]]:
+        """Yield every inventory item, newest first, without loading them all."""
+        return self._iter_dicts("SELECT * FROM inventory ORDER BY id DESC")
+
+    def count_inventory_items(self) -> int:
+        """Return the number of inventory rows without loading them."""
+        self.cursor.execute(SQL_COUNT_INVENTORY_ITEMS)
+        return int(self.cursor.fetchone()[0])
+
+    def get_inventory_pricing_rows(self, status: str = "In Stock") -> List[Tuple[Any, ...]]:
+        """Return the columns the price calculator needs for items in ``status``.
+
+        Rows are plain ``(id, title, cost, weight_lbs, length_in, width_in,
+        height_in)`` tuples, newest first.  ``cost`` falls back to
+        ``purchase_price`` and then 0, like the calculator's own lookup.
+        """
+        cursor = self.conn.cursor()
+        # Plain tuples: no sqlite3.Row or dict built per item
+        cursor.row_factory = None
+        cursor.execute(SQL_GET_INVENTORY_PRICING_ROWS, (status,))
+        return cursor.fetchall()
+
     def get_inventory_item(self, item_id: int):
         self.cursor.execute("SELECT * FROM inventory WHERE id=?", (item_id,))
         return self._row_to_dict(self.cursor.fetchone())
 
     def get_expenses(self):
-        self.cursor.execute("SELECT * FROM expenses ORDER BY date DESC, id DESC")
+        self.cursor.execute(SQL_GET_EXPENSES)
         return self._rows_to_dicts(self.cursor.fetchall())
 
+    def iter_expenses(self) -> Iterator[Dict[str, Any]]:
+        """Yield every expense in ``get_expenses`` order without loading them all."""
+        return self._iter_dicts(SQL_GET_EXPENSES)
+
+    def get_expenses_raw(self) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+        """Return the column names and a plain-tuple row iterator of all expenses.
+
+        Rows come in ``get_expenses`` order straight off the cursor.  No cost
+        aliases apply to expenses, so this holds the same data as
+        ``iter_expenses``.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(SQL_GET_EXPENSES)
+        return [d[0] for d in cursor.description], cursor
+
+    def count_expenses(self) -> int:
+        """Return the number of expense rows without loading them."""
+        self.cursor.execute(SQL_COUNT_EXPENSES)
+        return int(self.cursor.fetchone()[0])
+
     def get_expense(self, expense_id: int) -> Optional[Dict[str, Any]]:
         """Get a single expense by ID.
 
@@ -708,17 +960,14 @@ class Database:
         Returns:
             Dictionary containing expense data or None if not found
         """
-        self.cursor.execute("SELECT * FROM expenses WHERE id=?", (expense_id,))
+        self.cursor.execute(SQL_GET_EXPENSE, (expense_id,))
         return self._row_to_dict(self.cursor.fetchone())
 
     def get_expense_inventory_count(self, expense_id: int) -> int:
         """Return how many inventory items are linked to an expense."""
 
         try:
-            self.cursor.execute(
-                "SELECT COUNT(*) AS count FROM expense_inventory WHERE expense_id=?",
-                (expense_id,),
-            )
+            self.cursor.execute(SQL_GET_EXPENSE_INVENTORY_COUNT, (expense_id,))
             row = self.cursor.fetchone()
             return int(row["count"]) if row else 0
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -794,6 +1043,22 @@ class Database:
 
         return float(total)
 
+    def get_inventory_stats(self) -> Dict[str, Any]:
+        """Return status counts and the In Stock value with one aggregate query.
+
+        The value uses ``cost`` and falls back to ``purchase_price``, skipping
+        non-numeric legacy values the same way ``resolve_cost`` does.
+        """
+        self.cursor.execute(SQL_GET_INVENTORY_STATS)
+        row = self.cursor.fetchone()
+        return {
+            "total": int(row["total"] or 0),
+            "in_stock": int(row["in_stock"] or 0),
+            "listed": int(row["listed"] or 0),
+            "sold": int(row["sold"] or 0),
+            "in_stock_value": float(row["in_stock_value"] or 0.0),
+        }
+
     def get_total_revenue(self, year: Optional[int] = None) -> float:
         clauses = ["LOWER(status)='sold'"]
         params: List[Any] = []
@@ -1790,6 +2055,29 @@ class Database:
             self.log_error("get_setting", f"Failed to get setting {key}: {str(e)}")
             return default
 
+    def get_settings_bulk(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Return the stored values of several settings with one query.
+
+        Keys that are missing or stored as NULL are left out of the result,
+        so callers can fall back with ``.get(key, default)``.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        try:
+            placeholders = ",".join("?" * len(keys))
+            self.cursor.execute(
+                f"SELECT key, value FROM settings WHERE key IN ({placeholders})", keys
+            )
+            return {
+                row["key"]: row["value"]
+                for row in self.cursor.fetchall()
+                if row["value"] is not None
+            }
+        except Exception as e:
+            self.log_error("get_settings_bulk", f"Failed to get settings {keys}: {str(e)}")
+            return {}
+
     def set_setting(self, key: str, value: str):
         """Set a setting value.
 
@@ -1814,6 +2102,12 @@ class Database:
         """Close the database connection."""
         try:
             if hasattr(self, 'conn'):
-                self.conn.close()
+                try:
+                    if getattr(self, '_owns_wal', False):
+                        # Fold the WAL back into the main file and empty it, so
+                        # a closed database is a single self-contained file.
+                        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    self.conn.close()
         except Exception as e:
             print(f"Error closing database: {e}")
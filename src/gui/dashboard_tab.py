@@ -5,9 +5,13 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QGroupBox, QGridLayout, QFrame, QSizePolicy, QScrollArea)
 from PyQt6.QtCore import Qt
 from datetime import datetime
+import logging
 
 
 from .value_helpers import resolve_cost, format_currency
+from .workers import DatabaseWorker
+
+log = logging.getLogger(__name__)
 
 
 def _safe_float(value, default=0.0):
@@ -36,6 +40,8 @@ class DashboardTab(QWidget):
     def __init__(self, db):
         super().__init__()
         self.db = db
+        # Signals of the refresh_data worker whose result is still wanted
+        self._loader = None
         self.init_ui()
         self.refresh_data()
     
@@ -225,39 +231,92 @@ class DashboardTab(QWidget):
     
     def refresh_data(self):
         """Refresh all dashboard data"""
+        # The queries run on a worker thread with their own connection; the
+        # cards are filled in by _apply_metrics once they are done.
+        worker = DatabaseWorker(self.db, self.collect_metrics)
+        worker.signals.finished.connect(self._on_metrics_loaded)
+        worker.signals.failed.connect(self._on_metrics_failed)
+        self._loader = worker.signals
+        worker.start()
+
+    def _on_metrics_loaded(self, metrics):
+        if self.sender() is not self._loader:
+            return  # superseded by a newer refresh
+        self._loader = None
+        self._apply_metrics(metrics)
+
+    def _on_metrics_failed(self, message):
+        if self.sender() is not self._loader:
+            return
+        self._loader = None
+        log.warning("Error refreshing dashboard: %s", message)
+
+    @staticmethod
+    def collect_metrics(db):
+        """Query everything the dashboard shows; safe to call off the UI thread."""
         current_year = datetime.now().year
+        metrics = {}
         
         # Inventory metrics
-        inventory_items = [dict(item) for item in self.db.get_inventory_items(status='In Stock')]
-        inventory_value = self.db.get_inventory_value()
-        inventory_count = len(inventory_items)
+        inventory_items = [dict(item) for item in db.get_inventory_items(status='In Stock')]
+        metrics['inventory_value'] = db.get_inventory_value()
+        metrics['inventory_count'] = len(inventory_items)
+        
+        # Revenue metrics
+        total_revenue = db.get_total_revenue(current_year)
+        sales = [dict(row) for row in db.get_sales()]
+        year_sales = [s for s in sales if (s.get('sold_date') or '').startswith(str(current_year))]
+        metrics['total_revenue'] = total_revenue
+        metrics['sales_count'] = sum(_safe_int(s.get('quantity'), default=1) for s in year_sales)
+        
+        # Expenses metrics
+        all_expenses = [dict(expense) for expense in db.get_expenses()]
+        year_expenses = [e for e in all_expenses if (e.get('date') or '').startswith(str(current_year))]
+        metrics['total_expenses'] = sum(_safe_float(e.get('amount')) for e in year_expenses)
+        metrics['deductible_expenses'] = db.get_total_deductible_expenses(current_year)
+        
+        # Profit metrics
+        metrics['total_profit'] = db.get_total_profit(current_year)
+        metrics['se_tax_rate'] = _safe_float(
+            db.get_setting('self_employment_tax_rate', '0.153'),
+            default=0.153,
+        )
+        metrics['income_tax_rate'] = _safe_float(db.get_setting('income_tax_rate', '0.22'), default=0.22)
+        
+        # Quick stats, expense breakdown and recent activity
+        metrics['listed_count'] = len(db.get_inventory_items(status='Listed'))
+        metrics['expense_breakdown'] = db.get_expense_breakdown(current_year)
+        metrics['recent_sales'] = sales[:5]
+        metrics['recent_items'] = [dict(item) for item in db.get_inventory_items()[:5]]
+        return metrics
+
+    def _apply_metrics(self, metrics):
+        """Show the figures returned by collect_metrics"""
+        inventory_count = metrics['inventory_count']
+        inventory_value = metrics['inventory_value']
 
         self.inventory_card.main_label.setText(f"{inventory_count} items")
         # Shorten "Value" to "Val" to save space
         self.inventory_card.sub_label.setText(f"Val: ${inventory_value:.2f}")
         
         # Revenue metrics
-        total_revenue = self.db.get_total_revenue(current_year)
-        sales = [dict(row) for row in self.db.get_sales()]
-        year_sales = [s for s in sales if (s.get('sold_date') or '').startswith(str(current_year))]
-        sales_count = sum(_safe_int(s.get('quantity'), default=1) for s in year_sales)
+        total_revenue = metrics['total_revenue']
+        sales_count = metrics['sales_count']
         
         self.revenue_card.main_label.setText(f"${total_revenue:.2f}")
         # Display sales count with "YTD" abbreviation for Year‑To‑Date
         self.revenue_card.sub_label.setText(f"{sales_count} sales YTD")
         
         # Expenses metrics
-        all_expenses = [dict(expense) for expense in self.db.get_expenses()]
-        year_expenses = [e for e in all_expenses if (e.get('date') or '').startswith(str(current_year))]
-        total_expenses = sum(_safe_float(e.get('amount')) for e in year_expenses)
-        deductible_expenses = self.db.get_total_deductible_expenses(current_year)
+        total_expenses = metrics['total_expenses']
+        deductible_expenses = metrics['deductible_expenses']
         
         self.expenses_card.main_label.setText(f"${total_expenses:.2f}")
         # Shorten "Tax Deductible" to "Deductible" to conserve space
         self.expenses_card.sub_label.setText(f"Deductible: ${deductible_expenses:.2f}")
         
         # Profit metrics
-        total_profit = self.db.get_total_profit(current_year)
+        total_profit = metrics['total_profit']
         profit_margin = (total_profit / total_revenue * 100) if total_revenue > 0 else 0
         
         self.profit_card.main_label.setText(f"${total_profit:.2f}")
@@ -269,16 +328,11 @@ class DashboardTab(QWidget):
         # This is a rough estimate
         taxable_income = max(0, total_profit)
         
-        se_tax_rate = _safe_float(
-            self.db.get_setting('self_employment_tax_rate', '0.153'),
-            default=0.153,
-        )
         # Self-employment tax uses the configurable rate stored in settings.
-        self_employment_tax = taxable_income * se_tax_rate
+        self_employment_tax = taxable_income * metrics['se_tax_rate']
 
         # Estimated income tax (using 22% as rough estimate - user should set their bracket)
-        income_tax_rate = _safe_float(self.db.get_setting('income_tax_rate', '0.22'), default=0.22)
-        estimated_income_tax = taxable_income * income_tax_rate
+        estimated_income_tax = taxable_income * metrics['income_tax_rate']
         
         total_tax_liability = self_employment_tax + estimated_income_tax
         
@@ -287,8 +341,7 @@ class DashboardTab(QWidget):
         self.tax_card.sub_label.setText(f"SE: ${self_employment_tax:.2f} | Inc: ${estimated_income_tax:.2f}")
         
         # Quick stats
-        listed_items = self.db.get_inventory_items(status='Listed')
-        listed_count = len(listed_items)
+        listed_count = metrics['listed_count']
         avg_sale = (total_revenue / sales_count) if sales_count > 0 else 0
         
         # The quick stats card shows how many items are listed and the average sale price.
@@ -297,7 +350,7 @@ class DashboardTab(QWidget):
         self.stats_card.sub_label.setText(f"Avg: ${avg_sale:.2f}")
         
         # Expense breakdown
-        expense_breakdown = self.db.get_expense_breakdown(current_year)
+        expense_breakdown = metrics['expense_breakdown']
         if expense_breakdown:
             breakdown_text = "<b>Top Categories:</b><br>"
             for entry in expense_breakdown[:5]:  # Top 5
@@ -310,8 +363,8 @@ class DashboardTab(QWidget):
             self.expense_breakdown_label.setText("No expenses recorded yet")
         
         # Recent activity
-        recent_sales = sales[:5]
-        recent_items = [dict(item) for item in self.db.get_inventory_items()[:5]]
+        recent_sales = metrics['recent_sales']
+        recent_items = metrics['recent_items']
 
         activity_text = ""
         if recent_sales:
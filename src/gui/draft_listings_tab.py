@@ -3,23 +3,174 @@ Draft Listings Tab - Create eBay draft listing CSV files
 Supports individual listings and lot listings (multiple items combined)
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QLabel, QTableView, QHeaderView,
                              QLineEdit, QTextEdit, QGroupBox, QFormLayout,
                              QSpinBox, QDoubleSpinBox, QFileDialog, QMessageBox,
-                             QComboBox, QCheckBox, QDialog, QDialogButtonBox)
-from PyQt6.QtCore import Qt
+                             QComboBox, QDialog, QDialogButtonBox)
+from PyQt6.QtCore import Qt, QSortFilterProxyModel, pyqtSignal
 from datetime import datetime
 import csv
 import os
 
+from .models import InventoryModel
+from .value_helpers import format_currency
+
+# eBay Condition ID used when an item's condition is blank or unknown (Used)
+_DEFAULT_CONDITION_ID = "3000"
+
+
+def _condition_lookup(mapping):
+    """Return ``text -> Condition ID`` for ``mapping``, ignoring case and spaces."""
+    ids = {text.strip().lower(): cid for text, cid in mapping.items()}
+    return lambda text: ids.get((text or "").strip().lower(), _DEFAULT_CONDITION_ID)
+
+
+class DraftItemsProxy(QSortFilterProxyModel):
+    """Presents the shared inventory model as checkable draft candidates.
+
+    Rows are filtered by status and the first eight source columns are
+    relabeled with the draft columns below, so the draft view needs no copy
+    of the inventory rows.  Checked items are tracked by id.
+    """
+
+    HEADERS = [
+        "☑", "Title", "SKU", "Condition", "Purchase Cost",
+        "Listed Price", "Category ID", "Description"
+    ]
+
+    # Emitted whenever items are checked or unchecked
+    checkedChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._status = None
+        self._checked = set()
+
+    def set_status(self, status):
+        """Show rows with ``status`` only (None shows every non-sold row).
+
+        Checked items are cleared, as reloading the table used to do.
+        """
+        status = status.lower() if status else None
+        if status != self._status:
+            self._status = status
+            self.invalidateFilter()
+            self.set_all_checked(False)
+
+    def _accepts(self, item):
+        status = (item.get('status') or '').lower()
+        if self._status is None:
+            return status != 'sold'
+        return status == self._status
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        item = self.sourceModel().item_at(source_row)
+        return item is not None and self._accepts(item)
+
+    def filterAcceptsColumn(self, source_column, source_parent):
+        return source_column < len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section] if 0 <= section < len(self.HEADERS) else None
+        return super().headerData(section, orientation, role)
+
+    def _item(self, index):
+        return self.sourceModel().item_at(self.mapToSource(index).row())
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column != 0:
+                return None
+            item = self._item(index)
+            checked = item is not None and item['id'] in self._checked
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.DisplayRole:
+            item = self._item(index)
+            return self._display_text(item, column) if item is not None else None
+        return super().data(index, role)
+
+    @staticmethod
+    def _display_text(item, column):
+        """Return the text shown for ``item`` in draft ``column``."""
+        if column == 1:
+            return str(item.get("title") or "")
+        if column == 2:
+            return str(item.get("sku") or "")
+        if column == 3:
+            return str(item.get("condition") or "")
+        if column == 4:
+            return format_currency(item['_cost'] or 0)
+        if column == 5:
+            return format_currency(item.get("listed_price") or 0)
+        if column == 6:
+            return str(item.get("category_id") or "")
+        if column == 7:
+            desc = item.get("description") or ""
+            return desc[:50] + "..." if len(desc) > 50 else desc
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return super().setData(index, value, role)
+        item = self._item(index)
+        if item is None:
+            return False
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(item['id'])
+        else:
+            self._checked.discard(item['id'])
+        self.dataChanged.emit(index, index, [role])
+        self.checkedChanged.emit()
+        return True
+
+    def set_all_checked(self, checked):
+        """Check (or uncheck) every row that passes the filter."""
+        if checked:
+            source = self.sourceModel()
+            # Checking everything includes rows that are not paged in yet
+            while source.canFetchMore():
+                source.fetchMore()
+            self._checked = {self._item(self.index(row, 0))['id']
+                             for row in range(self.rowCount())}
+        elif not self._checked:
+            return
+        else:
+            self._checked = set()
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, 0),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        self.checkedChanged.emit()
+
+    def checked_items(self):
+        """Return the checked items still shown by the filter, in table order."""
+        return [item for item in self.sourceModel().items
+                if item['id'] in self._checked and self._accepts(item)]
+
 
 class DraftListingsTab(QWidget):
-    def __init__(self, db):
+    def __init__(self, db, model=None):
         super().__init__()
         self.db = db
+        # The inventory rows come from the model MainWindow shares with the
+        # inventory tab; standalone, the tab owns one.
+        if model is None:
+            model = InventoryModel(db, self)
+            model.loadFailed.connect(self._report_load_error)
+        self.model = model
         self.selected_items = []  # Track selected items for lot listings
         self.init_ui()
-        self.load_inventory()
+        self.model.refresh_if_stale()
     
     def init_ui(self):
         """Initialize the draft listings tab UI"""
@@ -33,7 +184,7 @@ class DraftListingsTab(QWidget):
         header.addStretch()
         
         refresh_btn = QPushButton("🔄 Refresh Inventory")
-        refresh_btn.clicked.connect(self.load_inventory)
+        refresh_btn.clicked.connect(self.model.refresh)
         header.addWidget(refresh_btn)
         
         layout.addLayout(header)
@@ -84,17 +235,20 @@ class DraftListingsTab(QWidget):
             "In Stock",
             "Listed"
         ])
-        self.status_filter.currentTextChanged.connect(self.load_inventory)
+        self.status_filter.currentTextChanged.connect(self.apply_filter)
         table_header.addWidget(self.status_filter)
         
         layout.addLayout(table_header)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "☑", "Title", "SKU", "Condition", "Purchase Cost", 
-            "Listed Price", "Category ID", "Description"
-        ])
+        self.proxy = DraftItemsProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.checkedChanged.connect(self.update_selected_count)
+        # Rows the model loads or drops can take checked items with them
+        self.proxy.modelReset.connect(self.update_selected_count)
+        self.proxy.rowsRemoved.connect(self.update_selected_count)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.verticalHeader().setVisible(False)
         
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Checkbox
@@ -107,7 +261,7 @@ class DraftListingsTab(QWidget):
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.Stretch)  # Description
         
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         layout.addWidget(self.table)
         
         # Action buttons
@@ -171,106 +325,30 @@ class DraftListingsTab(QWidget):
         layout.addLayout(generate_layout)
     
     def load_inventory(self):
-        """Load available inventory items (non-sold items by default)"""
-        try:
-            # Get filter value from combo box if it exists, otherwise default to showing all non-sold
-            if hasattr(self, 'status_filter'):
-                status = self.status_filter.currentText()
-                if status == "All Non-Sold Items":
-                    # Get items that are NOT sold
-                    items = self.db.get_inventory_items()
-                    items = [dict(item) if not isinstance(item, dict) else dict(item)
-                             for item in items]
-                    items = [item for item in items if (item.get('status') or '').lower() != 'sold']
-                else:
-                    items = self.db.get_items_for_drafts(status)
-                    items = [dict(item) if not isinstance(item, dict) else dict(item)
-                             for item in items]
-            else:
-                # Default: show all non-sold items
-                items = self.db.get_inventory_items()
-                items = [dict(item) if not isinstance(item, dict) else dict(item)
-                         for item in items]
-                items = [item for item in items if (item.get('status') or '').lower() != 'sold']
+        """Reload the shared inventory model if the database changed"""
+        self.model.refresh_if_stale()
 
-            self.table.setRowCount(0)
+    def apply_filter(self):
+        """Show the statuses picked in the filter combo"""
+        # Filtering happens on the rows already loaded; no database query.
+        status = self.status_filter.currentText()
+        self.proxy.set_status(None if status == "All Non-Sold Items" else status)
 
-            for item in items:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                
-                # Checkbox
-                checkbox = QCheckBox()
-                checkbox.stateChanged.connect(self.update_selected_count)
-                checkbox_widget = QWidget()
-                checkbox_layout = QHBoxLayout(checkbox_widget)
-                checkbox_layout.addWidget(checkbox)
-                checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                self.table.setCellWidget(row, 0, checkbox_widget)
-                
-                # Store item data in checkbox
-                checkbox.setProperty("item_data", dict(item))
-                
-                # Data columns
-                self.table.setItem(row, 1, QTableWidgetItem(str(item.get("title", ""))))
-                self.table.setItem(row, 2, QTableWidgetItem(str(item.get("sku", ""))))
-                self.table.setItem(row, 3, QTableWidgetItem(str(item.get("condition", ""))))
-
-                # Ensure numeric values with explicit type conversion
-                cost = float(item.get("purchase_price") or item.get("cost") or 0)
-                self.table.setItem(row, 4, QTableWidgetItem(f"${cost:.2f}"))
-
-                price = float(item.get("listed_price") or 0)
-                self.table.setItem(row, 5, QTableWidgetItem(f"${price:.2f}"))
-                
-                category = item.get("category_id", "")
-                self.table.setItem(row, 6, QTableWidgetItem(str(category)))
-                
-                desc = item.get("description", "")
-                if desc and len(desc) > 50:
-                    desc = desc[:50] + "..."
-                self.table.setItem(row, 7, QTableWidgetItem(desc))
-            
-            self.update_selected_count()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load inventory:\n{str(e)}")
+    def _report_load_error(self, message):
+        QMessageBox.critical(self, "Error", f"Failed to load inventory:\n{message}")
     
     def select_all_items(self):
         """Select all items in the table"""
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(True)
+        self.proxy.set_all_checked(True)
     
     def deselect_all_items(self):
         """Deselect all items in the table"""
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(False)
+        self.proxy.set_all_checked(False)
     
     def update_selected_count(self):
         """Update the count of selected items"""
-        count = 0
-        self.selected_items = []
-        
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    count += 1
-                    item_data = checkbox.property("item_data")
-                    if item_data:
-                        self.selected_items.append(item_data)
-        
-        self.selected_count_label.setText(f"Selected: {count} items")
+        self.selected_items = self.proxy.checked_items()
+        self.selected_count_label.setText(f"Selected: {len(self.selected_items)} items")
     
     def save_default_category(self):
         """Save the default category ID"""
@@ -301,7 +379,7 @@ class DraftListingsTab(QWidget):
         
         try:
             category_id = self.category_input.text().strip() or "47140"
-            condition_map = self.db.get_condition_id_mapping()
+            condition_id_for = _condition_lookup(self.db.get_condition_id_mapping())
             
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
                 # Write header lines (eBay format requirements)
@@ -328,8 +406,7 @@ class DraftListingsTab(QWidget):
                 
                 # Write each item
                 for item in self.selected_items:
-                    condition_text = item.get('condition', 'Used')
-                    condition_id = condition_map.get(condition_text, '3000')
+                    condition_id = condition_id_for(item.get('condition'))
                     
                     price = item.get('listed_price') or item.get('purchase_price') or 0
                     
@@ -556,9 +633,8 @@ class LotListingDialog(QDialog):
     
     def get_lot_data(self):
         """Get the lot listing data"""
-        condition_map = self.db.get_condition_id_mapping()
-        condition_text = self.condition_combo.currentText()
-        condition_id = condition_map.get(condition_text, '3000')
+        condition_id = _condition_lookup(self.db.get_condition_id_mapping())(
+            self.condition_combo.currentText())
         
         return {
             'title': self.title_input.text(),
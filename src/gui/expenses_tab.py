@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QHeaderView, QFileDialog, QGroupBox)
 from PyQt6.QtCore import Qt, QDate
 from datetime import datetime
+import os
 
 
 from .value_helpers import resolve_cost, format_currency
@@ -526,14 +527,27 @@ class AddEditExpenseDialog(QDialog):
             
             remove_btn = QPushButton("❌")
             remove_btn.setMaximumWidth(30)
-            remove_btn.clicked.connect(lambda checked, i=item: self.remove_inventory_item(i))
+            # Every row shares one slot; the item id travels on the button.
+            remove_btn.setProperty("item_id", item['id'])
+            remove_btn.clicked.connect(self._on_remove_clicked)
             item_layout.addWidget(remove_btn)
             
             self.inventory_items_layout.addWidget(item_widget)
     
+    def _on_remove_clicked(self):
+        """Remove the item attached to the clicked remove button"""
+        button = self.sender()
+        if button is None:
+            return
+        self.remove_inventory_item_by_id(button.property("item_id"))
+
     def remove_inventory_item(self, item):
         """Remove an inventory item from the selection"""
-        self.selected_inventory_items = [i for i in self.selected_inventory_items if i['id'] != item['id']]
+        self.remove_inventory_item_by_id(item['id'])
+
+    def remove_inventory_item_by_id(self, item_id):
+        """Remove the inventory item with ``item_id`` from the selection"""
+        self.selected_inventory_items = [i for i in self.selected_inventory_items if i['id'] != item_id]
         self.update_inventory_items_display()
 
     def on_category_changed(self):
@@ -599,14 +613,22 @@ class AddEditExpenseDialog(QDialog):
     
     def attach_receipt(self):
         """Attach a receipt file"""
+        # Start next to the current receipt, else where the last one came from
+        if self.receipt_path:
+            start_dir = os.path.dirname(self.receipt_path)
+        else:
+            start_dir = self.db.get_setting("last_receipt_dir") or ""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Receipt",
-            "",
+            start_dir,
             "Images (*.png *.jpg *.jpeg *.pdf);;All Files (*)"
         )
         
         if file_path:
+            folder = os.path.dirname(file_path)
+            if folder != start_dir:
+                self.db.set_setting("last_receipt_dir", folder)
             self.receipt_path = file_path
             self.receipt_label.setText(f"Receipt: {file_path.split('/')[-1]}")
     
@@ -2,22 +2,234 @@
 Inventory Tab - Manage inventory items
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLabel, QDialog,
+                             QTableView, QLabel, QDialog,
                              QFormLayout, QLineEdit, QTextEdit, QComboBox,
-                             QDateEdit, QDoubleSpinBox, QMessageBox, QHeaderView)
-from PyQt6.QtCore import Qt, QDate
+                             QDateEdit, QDoubleSpinBox, QMessageBox, QHeaderView,
+                             QStyledItemDelegate, QToolTip)
+from PyQt6.QtCore import (Qt, QDate, QEvent, QRect, QSortFilterProxyModel,
+                          QTimer, pyqtSignal)
+from PyQt6.QtGui import QColor, QPainter, QPixmap
 from datetime import datetime
+import logging
 
 
-from .value_helpers import resolve_cost, format_currency
+from .models import InventoryModel, prime_cost
+from .value_helpers import resolve_cost, parse_float
+
+log = logging.getLogger(__name__)
+
+
+# Stylesheets shared by every instance of a widget are kept as module
+# constants so the same string object is reused instead of rebuilt per call.
+_STATS_QSS = "background-color: #E3F2FD; padding: 10px; border-radius: 4px;"
+_SOLD_INFO_QSS = """
+    background-color: #E3F2FD;
+    padding: 10px;
+    border-radius: 4px;
+"""
+# Rich text shown by InventoryTab.view_item, filled with str.format_map
+_DETAILS_TMPL = """
+<h2>{title}</h2>
+<p><b>Brand:</b> {brand}</p>
+<p><b>Model:</b> {model}</p>
+<p><b>Condition:</b> {condition}</p>
+<p><b>Purchase Cost:</b> {cost}</p>
+<p><b>Purchase Date:</b> {purchase_date}</p>
+<p><b>Status:</b> {status}</p>
+<p><b>Storage Location:</b> {storage}</p>
+<p><b>Description:</b> {description}</p>
+<p><b>Notes:</b> {notes}</p>
+"""
+# Profit preview in the Mark as Sold dialog: neutral, profit, loss, bad input
+_PROFIT_QSS = """
+    background-color: #E8F5E9;
+    padding: 10px;
+    border-radius: 4px;
+    font-weight: bold;
+"""
+_PROFIT_OK_QSS = """
+    background-color: #E8F5E9;
+    padding: 10px;
+    border-radius: 4px;
+    font-weight: bold;
+    color: #4CAF50;
+"""
+_PROFIT_BAD_QSS = """
+    background-color: #FFEBEE;
+    padding: 10px;
+    border-radius: 4px;
+    font-weight: bold;
+    color: #F44336;
+"""
+_PROFIT_ERR_QSS = """
+    background-color: #FFF3E0;
+    padding: 10px;
+    border-radius: 4px;
+    font-weight: bold;
+"""
+_SOLD_SAVE_BTN_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+"""
+
+
+class InventoryFilterProxy(QSortFilterProxyModel):
+    """Filters the inventory model by status without reloading it."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._status = None
+
+    def set_status(self, status):
+        """Show only rows whose status matches ``status`` (None shows all)."""
+        status = status.lower() if status else None
+        if status != self._status:
+            self._status = status
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._status is None:
+            return True
+        item = self.sourceModel().item_at(source_row)
+        # Rows without a status are shown (and filtered) as In Stock
+        return item is not None and (item.get('status') or 'In Stock').lower() == self._status
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """Paints the View/Edit/Sold buttons of the Actions column.
+
+    Drawing the buttons avoids creating a QWidget with up to three styled
+    QPushButtons for every row.  Clicks are hit-tested against the painted
+    button rectangles and reported through ``actionTriggered``.
+    """
+
+    actionTriggered = pyqtSignal(int, str)
+
+    BUTTON_WIDTH = 28
+    SPACING = 2
+    MARGIN = 2
+    # action -> (glyph, tooltip, background colour)
+    ACTIONS = {
+        "view": ("👁", "View Details", "#2196F3"),
+        "edit": ("✏", "Edit Item", "#FF9800"),
+        "sold": ("💰", "Mark as Sold", "#4CAF50"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (action, height, device pixel ratio) -> rendered button pixmap
+        self._pixmaps = {}
+
+    def _button_pixmap(self, action, height, ratio):
+        """Return the button for ``action`` rendered once into a pixmap.
+
+        Shaping the emoji glyphs goes through font fallback on every
+        drawText call, so each button is rasterised once per size and then
+        blitted for every row.
+        """
+        key = (action, height, ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            glyph, _tooltip, color = self.ACTIONS[action]
+            pixmap = QPixmap(round(self.BUTTON_WIDTH * ratio), round(height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            rect = QRect(0, 0, self.BUTTON_WIDTH, height)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 3, 3)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, glyph)
+            painter.end()
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def _button_rects(self, rect, actions):
+        """Yield ``(action, QRect)`` for each button drawn inside ``rect``."""
+        height = max(rect.height() - 2 * self.MARGIN, 0)
+        x = rect.left() + self.MARGIN
+        for action in actions:
+            yield action, QRect(x, rect.top() + self.MARGIN, self.BUTTON_WIDTH, height)
+            x += self.BUTTON_WIDTH + self.SPACING
+
+    def _action_at(self, index, option, pos):
+        actions = index.data(InventoryModel.ACTIONS_ROLE) or ()
+        for action, rect in self._button_rects(option.rect, actions):
+            if rect.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        actions = index.data(InventoryModel.ACTIONS_ROLE) or ()
+        ratio = painter.device().devicePixelRatioF()
+        for action, rect in self._button_rects(option.rect, actions):
+            pixmap = self._button_pixmap(action, rect.height(), ratio)
+            painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        actions = index.data(InventoryModel.ACTIONS_ROLE) or ()
+        width = 2 * self.MARGIN + len(actions) * (self.BUTTON_WIDTH + self.SPACING)
+        size.setWidth(max(size.width(), width))
+        return size
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            action = self._action_at(index, option, event.position().toPoint())
+            if action:
+                self.actionTriggered.emit(index.data(InventoryModel.ITEM_ID_ROLE), action)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(index, option, event.pos())
+            if action:
+                QToolTip.showText(event.globalPos(), self.ACTIONS[action][1], view)
+                return True
+        return super().helpEvent(event, view, option, index)
 
 
 class InventoryTab(QWidget):
-    def __init__(self, db):
+    # Height of every table row in pixels
+    ROW_HEIGHT = 24
+    # Quiet period before a filter change is applied, in milliseconds
+    FILTER_DEBOUNCE_MS = 100
+
+    def __init__(self, db, model=None):
         super().__init__()
         self.db = db
+        # MainWindow passes the model it shares with the draft listings tab;
+        # standalone, the tab owns a model and reports its load errors itself.
+        if model is None:
+            model = InventoryModel(db, self)
+            model.loadFailed.connect(self._report_load_error)
+        self.model = model
+        # (db.revision, stats text) of the last statistics query
+        self._stats_cache = None
+        # Add/edit item dialog, built on first use and reused afterwards
+        self._editor = None
+        # Item details dialog, built on first use and reused afterwards
+        self._details_dialog = None
+        self._details_label = None
         self.init_ui()
-        self.refresh_data()
+        self.model.loaded.connect(self._on_inventory_loaded)
+        if not self.model.rowCount():
+            self.stats_label.setText("Loading inventory...")
+        if not self.model.refresh_if_stale():
+            # Another tab already loaded the shared rows
+            self._on_inventory_loaded()
     
     def init_ui(self):
         """Initialize the inventory tab UI"""
@@ -36,6 +248,12 @@ class InventoryTab(QWidget):
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["All Items", "In Stock", "Listed", "Sold"])
         self.filter_combo.currentTextChanged.connect(self.apply_filter)
+        # Coalesces bursts of filter changes (e.g. arrowing through the
+        # combo) into a single re-filter of the table.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_status_filter)
         header.addWidget(QLabel("Filter:"))
         header.addWidget(self.filter_combo)
         
@@ -53,22 +271,24 @@ class InventoryTab(QWidget):
         # Statistics bar
         stats_layout = QHBoxLayout()
         self.stats_label = QLabel()
-        self.stats_label.setStyleSheet("background-color: #E3F2FD; padding: 10px; border-radius: 4px;")
+        self.stats_label.setStyleSheet(_STATS_QSS)
         stats_layout.addWidget(self.stats_label)
         layout.addLayout(stats_layout)
         
         # Inventory table
-        self.table = QTableWidget()
-        self.table.setColumnCount(12)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Title", "Category", "SKU", "Brand/Model", "Condition", 
-            "Purchase Cost", "Listed Price", "Status", "Location", "Notes", "Actions"
-        ])
+        self.proxy = InventoryFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.actions_delegate = ActionsDelegate(self.table)
+        self.actions_delegate.actionTriggered.connect(self._on_row_action)
+        self.table.setItemDelegateForColumn(InventoryModel.ACTIONS_COLUMN,
+                                            self.actions_delegate)
         
         # Configure columns to be resizable by the user
         header = self.table.horizontalHeader()
         # Make all columns user-resizable
-        for col in range(self.table.columnCount()):
+        for col in range(self.model.columnCount()):
             header.setSectionResizeMode(col, QHeaderView.ResizeMode.Interactive)
         # Set reasonable initial widths for better UX
         header.resizeSection(0, 50)   # ID
@@ -87,12 +307,15 @@ class InventoryTab(QWidget):
         header.setStretchLastSection(True)
 
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.verticalHeader().setVisible(False)
-        # Enable word wrapping so that long titles or notes wrap to multiple
-        # lines instead of being truncated. This works in conjunction with
-        # stretchable columns defined above to improve readability.
-        self.table.setWordWrap(True)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setVisible(False)
+        # Fixed single-line rows: long titles or notes are elided instead of
+        # wrapped, so the view never measures text to size a row. The full
+        # text is available from View Details.
+        self.table.setWordWrap(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.ROW_HEIGHT)
         
         layout.addWidget(self.table)
         
@@ -113,186 +336,132 @@ class InventoryTab(QWidget):
     
     def refresh_data(self):
         """Refresh the inventory table"""
+        # The shared model queries on a worker thread so a large database
+        # doesn't freeze the window; _on_inventory_loaded runs once the rows
+        # are in, for this tab and every other view of the model.
+        if not self.model.rowCount():
+            self.stats_label.setText("Loading inventory...")
+        self.model.refresh()
+
+    def _on_inventory_loaded(self):
+        """Re-apply the filter and statistics to freshly loaded rows"""
         try:
-            # Get filter status
-            filter_text = self.filter_combo.currentText()
-            if filter_text == "All Items":
-                items = self.db.get_inventory_items()
-            else:
-                items = self.db.get_inventory_items(status=filter_text.replace(" ", "_"))
-            
-            # Clear the table first
-            self.table.clearContents()
-            self.table.setRowCount(0)
-            
-            # Update table with fresh data
-            self.table.setRowCount(len(items))
-            
-            for row, item in enumerate(items):
-                try:
-                    # Convert sqlite3.Row to dict for easier access
-                    item_dict = dict(item) if not isinstance(item, dict) else item
-                    
-                    self.table.setItem(row, 0, QTableWidgetItem(str(item_dict['id'])))
-                    self.table.setItem(row, 1, QTableWidgetItem(item_dict.get('title') or ''))
-                    self.table.setItem(row, 2, QTableWidgetItem(item_dict.get('category') or ''))
-                    self.table.setItem(row, 3, QTableWidgetItem(item_dict.get('sku') or ''))
-                    
-                    brand_model = f"{item_dict.get('brand') or ''} {item_dict.get('model') or ''}".strip()
-                    self.table.setItem(row, 4, QTableWidgetItem(brand_model))
-                    
-                    self.table.setItem(row, 5, QTableWidgetItem(item_dict.get('condition') or ''))
-                    cost_val = resolve_cost(item_dict)
-                    self.table.setItem(row, 6, QTableWidgetItem(format_currency(cost_val)))
-                    
-                    # Listed Price (not start_price)
-                    listed_price = f"${item_dict['listed_price']:.2f}" if item_dict.get('listed_price') else "N/A"
-                    self.table.setItem(row, 7, QTableWidgetItem(listed_price))
-                    
-                    self.table.setItem(row, 8, QTableWidgetItem(item_dict.get('status') or 'In Stock'))
-                    self.table.setItem(row, 9, QTableWidgetItem(item_dict.get('location') or ''))
-                    self.table.setItem(row, 10, QTableWidgetItem(item_dict.get('notes') or ''))
-                    
-                    # Actions - Multiple buttons in a widget
-                    actions_widget = QWidget()
-                    actions_layout = QHBoxLayout(actions_widget)
-                    actions_layout.setContentsMargins(2, 0, 2, 0)
-                    actions_layout.setSpacing(2)
-                    
-                    # View button - compact
-                    view_btn = QPushButton("👁")
-                    view_btn.setToolTip("View Details")
-                    view_btn.setMaximumWidth(32)
-                    view_btn.setStyleSheet(
-                        """
-                        QPushButton {
-                            padding: 4px;
-                            font-size: 14px;
-                            background-color: #2196F3;
-                            color: white;
-                            border-radius: 3px;
-                        }
-                        QPushButton:hover {
-                            background-color: #1976D2;
-                        }
-                        """
-                    )
-                    view_btn.clicked.connect(lambda checked, i=item_dict['id']: self.view_item(i))
-                    actions_layout.addWidget(view_btn)
-                    
-                    # Edit button - compact
-                    edit_btn = QPushButton("✏")
-                    edit_btn.setToolTip("Edit Item")
-                    edit_btn.setMaximumWidth(32)
-                    edit_btn.setStyleSheet(
-                        """
-                        QPushButton {
-                            padding: 4px;
-                            font-size: 14px;
-                            background-color: #FF9800;
-                            color: white;
-                            border-radius: 3px;
-                        }
-                        QPushButton:hover {
-                            background-color: #F57C00;
-                        }
-                        """
-                    )
-                    edit_btn.clicked.connect(lambda checked, i=item_dict['id']: self.edit_item(i))
-                    actions_layout.addWidget(edit_btn)
-            
-                    # Mark as Sold button (only for In Stock and Listed items)
-                    if item_dict.get('status') in ['In Stock', 'Listed', None]:
-                        sold_btn = QPushButton("💰")
-                        sold_btn.setToolTip("Mark as Sold")
-                        sold_btn.setMaximumWidth(32)
-                        sold_btn.setStyleSheet(
-                            """
-                            QPushButton {
-                                padding: 4px;
-                                font-size: 14px;
-                                background-color: #4CAF50;
-                                color: white;
-                                border-radius: 3px;
-                            }
-                            QPushButton:hover {
-                                background-color: #45a049;
-                            }
-                            """
-                        )
-                        sold_btn.clicked.connect(lambda checked, i=item_dict['id']: self.mark_as_sold_dialog(i))
-                        actions_layout.addWidget(sold_btn)
-                    
-                    self.table.setCellWidget(row, 11, actions_widget)  # Fixed: column 11 not 9
-                except Exception as e:
-                    print(f"Error loading row {row}: {e}")
-                    continue
+            self._apply_status_filter()
             
             # Update statistics
-            self.update_statistics(items)
+            self.update_statistics()
         except Exception as e:
-            print(f"Error refreshing data: {e}")
-            QMessageBox.warning(self, "Error", f"Error loading inventory: {str(e)}")
+            self._report_load_error(str(e))
+
+    def _report_load_error(self, message):
+        log.warning("Error refreshing data: %s", message)
+        QMessageBox.warning(self, "Error", f"Error loading inventory: {message}")
+
+    def _on_row_action(self, item_id, action):
+        """Dispatch a click on one of the painted row action buttons"""
+        handlers = {
+            "view": self.view_item,
+            "edit": self.edit_item,
+            "sold": self.mark_as_sold_dialog,
+        }
+        handlers[action](item_id)
+
+    def _lookup_item(self, item_id):
+        """Return the item for ``item_id``, reusing the row already loaded
+        into the table model and only querying the database as a fallback."""
+        return self.model.get_item(item_id) or self.db.get_inventory_item(item_id)
+
+    def _selected_item_id(self):
+        """Return the id of the item in the current table row, or None"""
+        index = self.proxy.mapToSource(self.table.currentIndex())
+        item = self.model.item_at(index.row()) if index.isValid() else None
+        return item['id'] if item else None
 
     # MainWindow expects inventory tabs to expose a load_inventory method so
     # that it can refresh the view whenever the tab becomes active. The
     # previous implementation only provided refresh_data, which meant the tab
     # never reloaded after an import performed elsewhere in the app. Providing
     # this thin wrapper keeps backwards compatibility with callers that expect
-    # load_inventory.
+    # load_inventory. The shared model is only reloaded if the database
+    # changed since its last load.
     def load_inventory(self):
-        self.refresh_data()
+        self.model.refresh_if_stale()
     
-    def update_statistics(self, items):
+    def update_statistics(self):
         """Update the statistics display"""
-        total_items = len(items)
-        in_stock = len([i for i in items if (i.get('status') or '').lower() == 'in stock'])
-        listed = len([i for i in items if (i.get('status') or '').lower() == 'listed'])
-        sold = len([i for i in items if (i.get('status') or '').lower() == 'sold'])
-
-        # Sum inventory value using whichever cost field is available
-        total_value = 0.0
-        for i in items:
-            try:
-                if (i.get('status') or '').lower() == 'in stock':
-                    cost_val = resolve_cost(i)
-                    if cost_val is not None:
-                        total_value += cost_val
-            except Exception:
-                continue
-
-        stats_text = f"Total Items: {total_items} | In Stock: {in_stock} | Listed: {listed} | Sold: {sold} | Inventory Value: ${total_value:.2f}"
-        self.stats_label.setText(stats_text)
+        # The figures only change when the database does, so filter changes
+        # and manual refreshes reuse the last result until a write happens.
+        revision = self.db.revision
+        if self._stats_cache is None or self._stats_cache[0] != revision:
+            stats = self.db.get_inventory_stats()
+            stats_text = (f"Total Items: {stats['total']} | In Stock: {stats['in_stock']} | "
+                          f"Listed: {stats['listed']} | Sold: {stats['sold']} | "
+                          f"Inventory Value: ${stats['in_stock_value']:.2f}")
+            self._stats_cache = (revision, stats_text)
+        self.stats_label.setText(self._stats_cache[1])
     
     def apply_filter(self):
         """Apply filter to table"""
-        self.refresh_data()
+        # Filtering happens on the rows already loaded; no database query.
+        self._filter_timer.start()
+
+    def _apply_status_filter(self):
+        self._filter_timer.stop()
+        filter_text = self.filter_combo.currentText()
+        self.proxy.set_status(None if filter_text == "All Items" else filter_text)
     
     def add_item_dialog(self):
         """Show dialog to add new inventory item"""
-        dialog = AddEditItemDialog(self.db, parent=self)
+        dialog = self._get_editor()
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
+            self._item_added(dialog.saved_item_id)
     
     def edit_item(self, item_id):
         """Show dialog to edit an item"""
-        dialog = AddEditItemDialog(self.db, item_id=item_id, parent=self)
+        dialog = self._get_editor(item_id, self.model.get_item(item_id))
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.refresh_data()
+            self._item_changed(item_id)
+
+    def _get_editor(self, item_id=None, item=None):
+        """Return the shared add/edit dialog prepared for ``item_id``"""
+        if self._editor is None:
+            self._editor = AddEditItemDialog(self.db, item_id=item_id, parent=self, item=item)
+        else:
+            self._editor.set_item(item_id, item)
+        return self._editor
+
+    # Single-row updates: after a dialog writes one item only that row of the
+    # model is patched, instead of reloading and repainting the whole table.
+    def _item_added(self, item_id):
+        item = self.db.get_inventory_item(item_id) if item_id is not None else None
+        if item:
+            self.model.insert_item(item)
+        self.update_statistics()
+
+    def _item_changed(self, item_id):
+        item = self.db.get_inventory_item(item_id)
+        if item:
+            self.model.update_item(item)
+        else:
+            self.model.remove_item(item_id)
+        self.update_statistics()
+
+    def _item_removed(self, item_id):
+        self.model.remove_item(item_id)
+        self.update_statistics()
     
     def edit_item_dialog(self):
         """Show dialog to edit selected item"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        item_id = self._selected_item_id()
+        if item_id is None:
             QMessageBox.warning(self, "No Selection", "Please select an item to edit.")
             return
         
-        item_id = int(self.table.item(current_row, 0).text())
         self.edit_item(item_id)
     
     def view_item(self, item_id):
         """View full item details"""
-        item = self.db.get_inventory_item(item_id)
+        item = self._lookup_item(item_id)
         if not item:
             return
         
@@ -303,43 +472,29 @@ class InventoryTab(QWidget):
         # Convert to dict if needed
         if not isinstance(item, dict):
             item = dict(item)
-        
-        title = item.get('title') or 'Untitled'
-        brand = item.get('brand') or 'N/A'
-        model = item.get('model') or 'N/A'
-        condition = item.get('condition') or 'N/A'
-
-        # Purchase cost formatting - try different cost fields
-        cost_str = format_currency(resolve_cost(item))
-        purchase_date = item.get('purchase_date') or 'N/A'
-        status = item.get('status') or 'N/A'
-        storage = item.get('location') or 'N/A'
-        description = item.get('description') or 'N/A'
-        notes = item.get('notes') or 'N/A'
-
-        # Build the HTML details string
-        details = f"""
-        <h2>{title}</h2>
-        <p><b>Brand:</b> {brand}</p>
-        <p><b>Model:</b> {model}</p>
-        <p><b>Condition:</b> {condition}</p>
-        <p><b>Purchase Cost:</b> {cost_str}</p>
-        <p><b>Purchase Date:</b> {purchase_date}</p>
-        <p><b>Status:</b> {status}</p>
-        <p><b>Storage Location:</b> {storage}</p>
-        <p><b>Description:</b> {description}</p>
-        <p><b>Notes:</b> {notes}</p>
-        """
+        prime_cost(item)
+        
+        details = _DETAILS_TMPL.format_map({
+            'title': item.get('title') or 'Untitled',
+            'brand': item.get('brand') or 'N/A',
+            'model': item.get('model') or 'N/A',
+            'condition': item.get('condition') or 'N/A',
+            'cost': item['_cost_str'],
+            'purchase_date': item.get('purchase_date') or 'N/A',
+            'status': item.get('status') or 'N/A',
+            'storage': item.get('location') or 'N/A',
+            'description': item.get('description') or 'N/A',
+            'notes': item.get('notes') or 'N/A',
+        })
 
-        # Display the details in a rich text message box. Use a try/except
+        # Display the details in a rich text dialog. Use a try/except
         # wrapper so that any unexpected errors during display are handled
         # gracefully instead of crashing the application.
         try:
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Item Details")
-            msg.setTextFormat(Qt.TextFormat.RichText)
-            msg.setText(details)
-            msg.exec()
+            dialog = self._get_details_dialog()
+            self._details_label.setText(details)
+            dialog.adjustSize()
+            dialog.exec()
         except Exception as e:
             print(f"Error displaying item details: {e}")
             error_msg = QMessageBox(self)
@@ -348,10 +503,30 @@ class InventoryTab(QWidget):
             error_msg.setText("Unable to display item details due to an unexpected error.")
             error_msg.exec()
     
+    def _get_details_dialog(self):
+        """Return the details dialog, creating it the first time"""
+        if self._details_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Item Details")
+            dialog.setMinimumWidth(400)
+            layout = QVBoxLayout(dialog)
+            self._details_label = QLabel()
+            self._details_label.setTextFormat(Qt.TextFormat.RichText)
+            self._details_label.setWordWrap(True)
+            layout.addWidget(self._details_label)
+            close_btn = QPushButton("Close")
+            close_btn.clicked.connect(dialog.accept)
+            close_row = QHBoxLayout()
+            close_row.addStretch()
+            close_row.addWidget(close_btn)
+            layout.addLayout(close_row)
+            self._details_dialog = dialog
+        return self._details_dialog
+
     def delete_item(self):
         """Delete selected item"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        item_id = self._selected_item_id()
+        if item_id is None:
             QMessageBox.warning(self, "No Selection", "Please select an item to delete.")
             return
         
@@ -363,13 +538,12 @@ class InventoryTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            item_id = int(self.table.item(current_row, 0).text())
             self.db.delete_inventory_item(item_id)
-            self.refresh_data()
+            self._item_removed(item_id)
 
     def mark_as_sold_dialog(self, item_id):
         """Show dialog to mark item as sold"""
-        item = self.db.get_inventory_item(item_id)
+        item = self._lookup_item(item_id)
         
         if not item:
             QMessageBox.warning(self, "Not Found", "Item not found.")
@@ -377,6 +551,7 @@ class InventoryTab(QWidget):
         
         if not isinstance(item, dict):
             item = dict(item)
+        prime_cost(item)
 
         # Create dialog
         dialog = QDialog(self)
@@ -388,13 +563,9 @@ class InventoryTab(QWidget):
         # Item info
         info_label = QLabel(
             f"<b>Item:</b> {item.get('title', 'Untitled')}"
-            f"<br><b>Cost:</b> {format_currency(resolve_cost(item))}"
+            f"<br><b>Cost:</b> {item['_cost_str']}"
         )
-        info_label.setStyleSheet("""
-            background-color: #E3F2FD;
-            padding: 10px;
-            border-radius: 4px;
-        """)
+        info_label.setStyleSheet(_SOLD_INFO_QSS)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
@@ -427,52 +598,35 @@ class InventoryTab(QWidget):
         
         # Profit calculation
         profit_label = QLabel()
-        profit_label.setStyleSheet("""
-            background-color: #E8F5E9;
-            padding: 10px;
-            border-radius: 4px;
-            font-weight: bold;
-        """)
+        profit_label.setStyleSheet(_PROFIT_QSS)
         layout.addWidget(profit_label)
+
+        # The cost doesn't change while the dialog is open
+        cost = item['_cost'] or 0.0
+
+        def set_profit_style(qss):
+            # Restyling re-polishes the label, so only do it when it changes
+            if profit_label.styleSheet() != qss:
+                profit_label.setStyleSheet(qss)
         
         # Update profit calculation
         def update_profit():
-            try:
-                cost = resolve_cost(item) or 0.0
-                sale_price = float(sale_price_input.text() or 0)
-                fees = float(fees_input.text() or 0)
-                profit = sale_price - cost - fees
-                margin = (profit / cost * 100) if cost > 0 else 0
-                
-                profit_label.setText(
-                    f"💰 Profit: ${profit:.2f} | Margin: {margin:.1f}%"
-                )
-                
-                # Color code
-                if profit > 0:
-                    profit_label.setStyleSheet("""
-                        background-color: #E8F5E9;
-                        padding: 10px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        color: #4CAF50;
-                    """)
-                else:
-                    profit_label.setStyleSheet("""
-                        background-color: #FFEBEE;
-                        padding: 10px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                        color: #F44336;
-                    """)
-            except ValueError:
+            sale_price = parse_float(sale_price_input.text(), 0.0)
+            fees = parse_float(fees_input.text(), 0.0)
+            if sale_price is None or fees is None:
                 profit_label.setText("⚠️ Enter valid numbers")
-                profit_label.setStyleSheet("""
-                    background-color: #FFF3E0;
-                    padding: 10px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                """)
+                set_profit_style(_PROFIT_ERR_QSS)
+                return
+
+            profit = sale_price - cost - fees
+            margin = (profit / cost * 100) if cost > 0 else 0
+            
+            profit_label.setText(
+                f"💰 Profit: ${profit:.2f} | Margin: {margin:.1f}%"
+            )
+            
+            # Color code
+            set_profit_style(_PROFIT_OK_QSS if profit > 0 else _PROFIT_BAD_QSS)
         
         sale_price_input.textChanged.connect(update_profit)
         fees_input.textChanged.connect(update_profit)
@@ -482,17 +636,7 @@ class InventoryTab(QWidget):
         button_layout = QHBoxLayout()
         
         save_btn = QPushButton("💰 Mark as Sold")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        save_btn.setStyleSheet(_SOLD_SAVE_BTN_QSS)
         save_btn.clicked.connect(lambda: self.save_sold_item(
             dialog,
             item_id,
@@ -513,52 +657,80 @@ class InventoryTab(QWidget):
     
     def save_sold_item(self, dialog, item_id, sale_price, sale_date, platform, fees):
         """Save item as sold"""
-        try:
-            sale_price_val = float(sale_price) if sale_price else 0
-            fees_val = float(fees) if fees else 0
-            
-            if sale_price_val <= 0:
-                QMessageBox.warning(self, "Invalid Price", "Please enter a valid sale price.")
-                return
-            
-            # Mark as sold in database
-            self.db.mark_item_as_sold(
-                item_id,
-                sale_price=sale_price_val,
-                sale_date=sale_date,
-                platform=platform,
-                fees=fees_val
-            )
-            
-            QMessageBox.information(
-                self,
-                "✅ Item Sold!",
-                f"Item marked as sold!\n\n"
-                f"Sale Price: ${sale_price_val:.2f}\n"
-                f"Platform: {platform}\n\n"
-                f"Check the 'Sold Items' tab to see your sales history!"
-            )
-            dialog.accept()
-            self.refresh_data()
-            
-        except ValueError:
+        sale_price_val = parse_float(sale_price, 0.0)
+        fees_val = parse_float(fees, 0.0)
+        if sale_price_val is None or fees_val is None:
             QMessageBox.warning(self, "Invalid Input", "Please enter valid numbers for price and fees.")
+            return
+        
+        if sale_price_val <= 0:
+            QMessageBox.warning(self, "Invalid Price", "Please enter a valid sale price.")
+            return
+        
+        # Mark as sold in database
+        self.db.mark_item_as_sold(
+            item_id,
+            sale_price=sale_price_val,
+            sale_date=sale_date,
+            platform=platform,
+            fees=fees_val
+        )
+        
+        QMessageBox.information(
+            self,
+            "✅ Item Sold!",
+            f"Item marked as sold!\n\n"
+            f"Sale Price: ${sale_price_val:.2f}\n"
+            f"Platform: {platform}\n\n"
+            f"Check the 'Sold Items' tab to see your sales history!"
+        )
+        dialog.accept()
+        self._item_changed(item_id)
 
 
 class AddEditItemDialog(QDialog):
     """Dialog for adding or editing inventory items"""
-    def __init__(self, db, item_id=None, parent=None):
+    def __init__(self, db, item_id=None, parent=None, item=None):
         super().__init__(parent)
         self.db = db
-        self.item_id = item_id
+        self.item_id = None
+        self._item = None
+        self.saved_item_id = None
         self.init_ui()
-        
+        self.set_item(item_id, item)
+
+    def set_item(self, item_id=None, item=None):
+        """Prepare the form for adding (no ``item_id``) or editing an item.
+
+        The dialog is reused between opens, so every field is reset first.
+        ``item`` is the already-loaded record for ``item_id``; it is fetched
+        from the database when omitted.
+        """
+        self.item_id = item_id
+        self._item = item
+        # Id of the row written by save_item (new id when adding)
+        self.saved_item_id = None
+        self.setWindowTitle("Add Inventory Item" if not item_id else "Edit Inventory Item")
+        self.reset()
         if item_id:
             self.load_item_data()
+
+    def reset(self):
+        """Clear every field back to its default value"""
+        for line_edit in (self.title_input, self.brand_input, self.model_input,
+                          self.upc_input, self.source_input, self.storage_input):
+            line_edit.clear()
+        self.condition_combo.setCurrentIndex(0)
+        for spin_box in (self.cost_input, self.weight_input, self.length_input,
+                         self.width_input, self.height_input):
+            spin_box.setValue(0)
+        self.date_input.setDate(QDate.currentDate())
+        self.description_input.clear()
+        self.notes_input.clear()
+        self.title_input.setFocus()
     
     def init_ui(self):
         """Initialize the dialog UI"""
-        self.setWindowTitle("Add Inventory Item" if not self.item_id else "Edit Inventory Item")
         self.setMinimumWidth(500)
         
         layout = QFormLayout(self)
@@ -648,7 +820,7 @@ class AddEditItemDialog(QDialog):
     
     def load_item_data(self):
         """Load existing item data into form"""
-        item = self.db.get_inventory_item(self.item_id)
+        item = self._item or self.db.get_inventory_item(self.item_id)
         if not item:
             return
 
@@ -722,9 +894,10 @@ class AddEditItemDialog(QDialog):
             # Save to database
             if self.item_id:
                 self.db.update_inventory_item(self.item_id, item_data)
+                self.saved_item_id = self.item_id
                 QMessageBox.information(self, "Success", "Item updated successfully!")
             else:
-                self.db.add_inventory_item(item_data)
+                self.saved_item_id = self.db.add_inventory_item(item_data)
                 QMessageBox.information(self, "Success", "Item added successfully!")
             
             self.accept()
@@ -3,37 +3,138 @@ Main Window for eBay Reseller Manager
 FIXED VERSION - Added missing Pricing Tab
 """
 from PyQt6.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
-                             QLabel, QStatusBar, QMessageBox, QApplication, QDialog)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+                             QLabel, QStatusBar, QMessageBox, QApplication, QDialog,
+                             QCheckBox)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QIcon, QPainter, QPixmap
+import importlib
+import logging
 import sys
 import os
 
-# Import tab widgets
-from gui.dashboard_tab import DashboardTab
-from gui.inventory_tab import InventoryTab
-from gui.expenses_tab import ExpensesTab
-from gui.pricing_tab import PricingTab  # FIXED: Added missing import
-from gui.sold_items_tab import SoldItemsTab
-from gui.reports_tab import ReportsTab
-from gui.draft_listings_tab import DraftListingsTab
+from gui.models import InventoryModel
+
+log = logging.getLogger(__name__)
+
+# Application-wide Qt stylesheet shipped next to this module
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.qss")
+
+
+def _read_stylesheet(path):
+    """Return the text of the stylesheet at ``path`` (empty if unreadable)."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return handle.read()
+    except OSError as e:
+        log.warning("Error loading stylesheet: %s", e)
+        return ""
+
+
+# Read once at import; every window and install_stylesheet() call shares
+# this one string.
+_MAIN_QSS = _read_stylesheet(STYLESHEET_PATH)
+
+
+def load_stylesheet():
+    """Return the contents of ``style.qss`` (empty if it can't be read)."""
+    return _MAIN_QSS
+
+
+def install_stylesheet(app):
+    """Style the whole application once at startup.
+
+    Setting the sheet on the ``QApplication`` instead of on each window
+    means Qt parses it a single time and every window and dialog shares it.
+    Re-installing the same sheet is skipped, since every setStyleSheet call
+    re-polishes all widgets.
+    """
+    qss = load_stylesheet()
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
 
 
 class MainWindow(QMainWindow):
+    # (key, "module:Class", tab label) in display order.  Only the first
+    # tab is built at startup; the others start as empty placeholders, and
+    # their module is imported and the widget constructed the first time
+    # they are selected.
+    TAB_SPECS = (
+        ("dashboard", "gui.dashboard_tab:DashboardTab", "Dashboard"),
+        ("inventory", "gui.inventory_tab:InventoryTab", "Inventory"),
+        ("expenses", "gui.expenses_tab:ExpensesTab", "Expenses"),
+        ("pricing", "gui.pricing_tab:PricingTab", "Price Calculator"),
+        ("sold_items", "gui.sold_items_tab:SoldItemsTab", "Sold Items"),
+        ("draft_listings", "gui.draft_listings_tab:DraftListingsTab", "Draft Listings"),
+        ("reports", "gui.reports_tab:ReportsTab", "Reports"),
+    )
+    # Emoji shown as each tab's icon.  They are rasterised once by
+    # _tab_icon, so the tab bar blits a pixmap instead of going through
+    # emoji font fallback on every repaint.
+    TAB_GLYPHS = {
+        "dashboard": "📊",
+        "inventory": "📦",
+        "expenses": "💵",
+        "pricing": "🏷️",
+        "sold_items": "💰",
+        "draft_listings": "📝",
+        "reports": "📈",
+    }
+    # Methods that reload each tab, in order of preference.  The first one a
+    # tab actually has is bound once, when the tab is constructed.
+    REFRESH_METHODS = {
+        "dashboard": ("refresh_dashboard", "refresh_data"),
+        "inventory": ("load_inventory",),
+        "expenses": ("load_expenses", "refresh_data"),
+        "pricing": ("load_inventory_items",),
+        "sold_items": ("load_sold_items",),
+        "draft_listings": ("load_inventory",),
+        "reports": ("load_analytics",),
+    }
+    # Tabs constructed with the shared inventory model
+    INVENTORY_MODEL_TABS = frozenset({"inventory", "draft_listings"})
+    # Quiet period before refresh_all_tabs() reloads, in milliseconds
+    REFRESH_DEBOUNCE_MS = 50
+    # Delay after startup before the settings dialog module is imported
+    SETTINGS_PREWARM_MS = 2000
+
     def __init__(self, db):
         super().__init__()
         self.db = db
+        # Inventory rows shared by the inventory and draft listing tabs, so
+        # both views are refreshed by a single query.  The tabs load it when
+        # they are first built.
+        self.inventory_model = InventoryModel(db, self)
+        self.inventory_model.loadFailed.connect(self._on_inventory_load_failed)
+        # Tabs constructed so far, keyed by TAB_SPECS key
+        self._tab_instances = {}
+        # db.revision when each tab last loaded its data.  A tab is only
+        # refreshed on selection if the database changed since then or it
+        # was flagged through mark_dirty().
+        self._tab_revisions = {}
+        self._dirty_tabs = set()
+        # Bound refresh method (or None) per constructed tab
+        self._refresh_handlers = {}
+        # Tab whose refresh is queued behind the tab-switch repaint
+        self._pending_refresh_index = None
+        # Coalesces refresh_all_tabs() bursts into one reload of the
+        # visible tab
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_coalesced_refresh)
+        # Rendered tab icons keyed by TAB_SPECS key
+        self._tab_icons = {}
+        # SettingsDialog class once imported (see _prewarm_settings)
+        self._settings_dialog_cls = None
+        # Message boxes are built on first use and reused afterwards
+        self._msg_box = None
+        self._confirm_exit = None
+        # Each tab is also reachable as self.<key>_tab once it exists
+        for key, _target, _label in self.TAB_SPECS:
+            setattr(self, f"{key}_tab", None)
         self.init_ui()
         
-    def closeEvent(self, event):
-        """Handle window close event to clean up database connection."""
-        try:
-            if hasattr(self, 'db'):
-                self.db.close()
-        except Exception as e:
-            print(f"Error closing database connection: {e}")
-        event.accept()
-    
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("eBay Reseller Manager")
@@ -69,60 +170,22 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.TabPosition.North)
         
-        # Create tabs with error handling
+        # Add tabs. Only the initially visible one is constructed now; the
+        # others hit the database and build their widgets on first visit.
+        # Adding them with updates and signals off lays the tab bar out once
+        # instead of after every addTab.
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
         try:
-            self.dashboard_tab = DashboardTab(self.db)
-        except Exception as e:
-            print(f"Error creating Dashboard tab: {e}")
-            self.dashboard_tab = QWidget()  # Fallback empty widget
-        
-        try:
-            self.inventory_tab = InventoryTab(self.db)
-        except Exception as e:
-            print(f"Error creating Inventory tab: {e}")
-            self.inventory_tab = QWidget()
-        
-        try:
-            self.expenses_tab = ExpensesTab(self.db)
-        except Exception as e:
-            print(f"Error creating Expenses tab: {e}")
-            self.expenses_tab = QWidget()
-        
-        try:
-            self.pricing_tab = PricingTab(self.db)  # FIXED: Added missing tab
-        except Exception as e:
-            print(f"Error creating Pricing tab: {e}")
-            self.pricing_tab = QWidget()
-        
-        try:
-            self.sold_items_tab = SoldItemsTab(self.db)
-        except Exception as e:
-            print(f"Error creating Sold Items tab: {e}")
-            self.sold_items_tab = QWidget()
-        
-        try:
-            self.reports_tab = ReportsTab(self.db)
-        except Exception as e:
-            print(f"Error creating Reports tab: {e}")
-            self.reports_tab = QWidget()
-        
-        try:
-            self.draft_listings_tab = DraftListingsTab(self.db)
-        except Exception as e:
-            print(f"Error creating Draft Listings tab: {e}")
-            self.draft_listings_tab = QWidget()
-        
-        # Add tabs
-        self.tabs.addTab(self.dashboard_tab, "📊 Dashboard")
-        self.tabs.addTab(self.inventory_tab, "📦 Inventory")
-        self.tabs.addTab(self.expenses_tab, "💵 Expenses")
-        self.tabs.addTab(self.pricing_tab, "🏷️ Price Calculator")  # FIXED: Added missing tab
-        self.tabs.addTab(self.sold_items_tab, "💰 Sold Items")
-        self.tabs.addTab(self.draft_listings_tab, "📝 Draft Listings")
-        self.tabs.addTab(self.reports_tab, "📈 Reports")
+            for index, (key, _target, label) in enumerate(self.TAB_SPECS):
+                widget = self._create_tab(index) if index == 0 else QWidget()
+                self.tabs.addTab(widget, self._tab_icon(key), label)
+        finally:
+            self.tabs.blockSignals(False)
+            self.tabs.setUpdatesEnabled(True)
         
         # Connect tab change signal to refresh data
-        self.tabs.currentChanged.connect(self.on_tab_changed)
+        self.tabs.currentChanged.connect(self._queue_tab_refresh)
         
         layout.addWidget(self.tabs)
         
@@ -130,203 +193,148 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
-        
-        # Apply styling
-        self.apply_stylesheet()
-    
-    def apply_stylesheet(self):
-        """Apply custom stylesheet for better appearance"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: white;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                color: #333333; /* Dark tab text for readability */
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid #0066cc;
-                color: #333333; /* Maintain dark text on selected tab */
-            }
-            QTabBar::tab:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0052a3;
-            }
-            QPushButton:pressed {
-                background-color: #003d7a;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: white;
-                color: #333333; /* Ensure text is dark on a light background */
-            }
-            QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, 
-            QDoubleSpinBox:focus, QComboBox:focus {
-                border: 2px solid #0066cc;
-            }
-            QComboBox::drop-down {
-                border: none;
-                background-color: #e0e0e0;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #666;
-                margin-right: 6px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                border: 2px solid #cccccc;
-                selection-background-color: #0066cc;
-                selection-color: #ffffff;
-                outline: 0px;
-                show-decoration-selected: 1;
-            }
-            QComboBox QListView {
-                background-color: #ffffff;
-                border: none;
-                outline: 0px;
-            }
-            QComboBox QListView::item {
-                height: 28px;
-                padding-left: 10px;
-                padding-right: 10px;
-                background-color: #ffffff;
-                color: #000000;
-                border: none;
-            }
-            QComboBox QListView::item:hover {
-                background-color: #bbdefb;
-                color: #000000;
-            }
-            QComboBox QListView::item:selected {
-                background-color: #0066cc;
-                color: #ffffff;
-            }
-            QComboBox QListView::item:selected:hover {
-                background-color: #0052a3;
-                color: #ffffff;
-            }
-            QTableWidget {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                gridline-color: #e0e0e0;
-                background-color: white;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #0066cc;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 8px;
-                border: none;
-                border-right: 1px solid #cccccc;
-                border-bottom: 1px solid #cccccc;
-                font-weight: bold;
-            }
-        """)
+
+        # Import the settings dialog once the window is idle, so the first
+        # File > Settings click doesn't wait on the import.
+        QTimer.singleShot(self.SETTINGS_PREWARM_MS, self._prewarm_settings)
     
+    def _tab_icon(self, key, size=32):
+        """Return the icon for tab ``key``, rendering its glyph on first use"""
+        icon = self._tab_icons.get(key)
+        if icon is None:
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            font = painter.font()
+            font.setPixelSize(int(size * 0.8))
+            painter.setFont(font)
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter,
+                             self.TAB_GLYPHS.get(key, ""))
+            painter.end()
+            icon = self._tab_icons[key] = QIcon(pixmap)
+        return icon
+
+    def _create_tab(self, index):
+        """Construct the tab at ``index`` with error handling"""
+        key, target, label = self.TAB_SPECS[index]
+        try:
+            module_name, class_name = target.split(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            if key in self.INVENTORY_MODEL_TABS:
+                widget = cls(self.db, model=self.inventory_model)
+            else:
+                widget = cls(self.db)
+        except Exception as e:
+            log.exception("Error creating %s tab", label)
+            # Say why the tab is blank instead of showing an empty widget
+            widget = QLabel(f"{label} is unavailable:\n{e}")
+            widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._tab_instances[key] = widget
+        setattr(self, f"{key}_tab", widget)
+        self._refresh_handlers[key] = next(
+            (getattr(widget, name) for name in self.REFRESH_METHODS.get(key, ())
+             if hasattr(widget, name)),
+            None,
+        )
+        self._mark_clean(key)
+        return widget
+
+    def mark_dirty(self, *keys):
+        """Flag tabs (TAB_SPECS keys; all tabs when omitted) as stale.
+
+        The flagged tabs reload the next time they are selected; the
+        currently visible tab is not refreshed by this call.
+        """
+        self._dirty_tabs.update(keys or (key for key, _target, _label in self.TAB_SPECS))
+
+    def _mark_clean(self, key):
+        self._dirty_tabs.discard(key)
+        self._tab_revisions[key] = self.db.revision
+
+    def _is_stale(self, key):
+        return key in self._dirty_tabs or self._tab_revisions.get(key) != self.db.revision
+
+    def _ensure_tab(self, index):
+        """Swap the placeholder at ``index`` for the real tab.
+
+        Returns ``True`` when the tab was constructed by this call; a new
+        tab has just loaded its data so it doesn't need a refresh.
+        """
+        if not 0 <= index < len(self.TAB_SPECS):
+            return False
+        key, _target, label = self.TAB_SPECS[index]
+        if key in self._tab_instances:
+            return False
+        widget = self._create_tab(index)
+        placeholder = self.tabs.widget(index)
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, self._tab_icon(key), label)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+            self.tabs.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+        return True
+
+    def _queue_tab_refresh(self, index):
+        """Run on_tab_changed after Qt has painted the newly selected tab.
+
+        Only the latest selection is kept, so flipping quickly through
+        several tabs builds and refreshes just the one the user stops on.
+        """
+        first = self._pending_refresh_index is None
+        self._pending_refresh_index = index
+        if first:
+            QTimer.singleShot(0, self._run_queued_tab_refresh)
+
+    def _run_queued_tab_refresh(self):
+        index, self._pending_refresh_index = self._pending_refresh_index, None
+        if index is not None and index == self.tabs.currentIndex():
+            self.on_tab_changed(index)
+
     def on_tab_changed(self, index):
         """Handle tab changes to refresh data"""
         try:
-            current_tab = self.tabs.widget(index)
-            
-            # Refresh dashboard when switched to
-            if isinstance(current_tab, DashboardTab):
-                if hasattr(current_tab, 'refresh_dashboard'):
-                    current_tab.refresh_dashboard()
-                elif hasattr(current_tab, 'refresh_data'):
-                    current_tab.refresh_data()
-            
-            # Refresh sold items when switched to
-            elif isinstance(current_tab, SoldItemsTab):
-                if hasattr(current_tab, 'load_sold_items'):
-                    current_tab.load_sold_items()
-            
-            # Refresh inventory when switched to
-            elif isinstance(current_tab, InventoryTab):
-                if hasattr(current_tab, 'load_inventory'):
-                    current_tab.load_inventory()
-            
-            # Refresh expenses when switched to
-            elif isinstance(current_tab, ExpensesTab):
-                if hasattr(current_tab, 'load_expenses'):
-                    current_tab.load_expenses()
-            
-            # FIXED: Refresh pricing tab when switched to
-            elif isinstance(current_tab, PricingTab):
-                if hasattr(current_tab, 'load_inventory_items'):
-                    current_tab.load_inventory_items()
-            
-            # Refresh reports when switched to
-            elif isinstance(current_tab, ReportsTab):
-                if hasattr(current_tab, 'generate_report'):
-                    current_tab.generate_report()
-            
-            # Refresh draft listings when switched to
-            elif isinstance(current_tab, DraftListingsTab):
-                if hasattr(current_tab, 'load_inventory'):
-                    current_tab.load_inventory()
-        except Exception as e:
-            # Silently ignore tab refresh errors to prevent crashes
-            print(f"Warning: Error refreshing tab: {e}")
+            if self._ensure_tab(index):
+                return
+            key = self.TAB_SPECS[index][0]
+            if not self._is_stale(key):
+                # Nothing changed since this tab last loaded
+                return
+            handler = self._refresh_handlers.get(key)
+            if handler is not None:
+                handler()
+            self._mark_clean(key)
+        except Exception:
+            # Log tab refresh errors instead of letting them crash the app
+            log.exception("Error refreshing tab %d", index)
     
     def show_message(self, title, message, icon=QMessageBox.Icon.Information):
         """Show a message box"""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setIcon(icon)
-        msg_box.exec()
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(message)
+        self._msg_box.setIcon(icon)
+        self._msg_box.exec()
     
     def open_settings(self):
         """Open the settings dialog"""
-        from gui.settings_dialog import SettingsDialog
-        dialog = SettingsDialog(self.db, self)
+        dialog = self._prewarm_settings()(self.db, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Refresh all tabs to apply new settings
             self.refresh_all_tabs()
     
+    def _prewarm_settings(self):
+        """Import and remember the SettingsDialog class"""
+        if self._settings_dialog_cls is None:
+            from gui.settings_dialog import SettingsDialog
+            self._settings_dialog_cls = SettingsDialog
+        return self._settings_dialog_cls
+
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
@@ -350,40 +358,56 @@ class MainWindow(QMainWindow):
     
     def refresh_all_tabs(self):
         """Refresh all tabs to apply new settings"""
-        try:
-            # Refresh each tab
-            if hasattr(self.dashboard_tab, 'refresh_dashboard'):
-                self.dashboard_tab.refresh_dashboard()
-            elif hasattr(self.dashboard_tab, 'refresh_data'):
-                self.dashboard_tab.refresh_data()
-            
-            if hasattr(self.inventory_tab, 'load_inventory'):
-                self.inventory_tab.load_inventory()
-            
-            if hasattr(self.expenses_tab, 'load_expenses'):
-                self.expenses_tab.load_expenses()
-            
-            if hasattr(self.sold_items_tab, 'load_sold_items'):
-                self.sold_items_tab.load_sold_items()
-            
-            if hasattr(self.draft_listings_tab, 'load_inventory'):
-                self.draft_listings_tab.load_inventory()
-        except Exception as e:
-            print(f"Error refreshing tabs: {e}")
+        # Only the visible tab reloads, once the calls stop arriving; the
+        # others are flagged and reload when next selected.  Tabs that
+        # haven't been built yet load fresh data when first shown.
+        self.mark_dirty()
+        self._refresh_timer.start()
+
+    def _do_coalesced_refresh(self):
+        # One reload of the shared model serves both inventory views; their
+        # refresh handlers skip it while it is in flight.
+        if self.inventory_model.is_loaded:
+            self.inventory_model.refresh()
+        self.on_tab_changed(self.tabs.currentIndex())
+
+    def _on_inventory_load_failed(self, message):
+        self.show_message("Error", f"Error loading inventory: {message}",
+                          QMessageBox.Icon.Warning)
     
     def closeEvent(self, event):
         """Handle window close event"""
-        reply = QMessageBox.question(
-            self,
-            'Confirm Exit',
-            'Are you sure you want to exit?',
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
+        # Users can turn the confirmation off from the dialog itself
+        if self.db.get_setting('skip_exit_confirm', '0') == '1':
+            self._close_database()
+            event.accept()
+            return
+
+        if self._confirm_exit is None:
+            self._confirm_exit = QMessageBox(
+                QMessageBox.Icon.Question,
+                'Confirm Exit',
+                'Are you sure you want to exit?',
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self,
+            )
+            self._confirm_exit.setDefaultButton(QMessageBox.StandardButton.No)
+            # Parented to the box so the checkbox lives as long as it does
+            self._skip_confirm_check = QCheckBox("Don't ask again", self._confirm_exit)
+            self._confirm_exit.setCheckBox(self._skip_confirm_check)
+        reply = self._confirm_exit.exec()
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Close database connection
-            self.db.close()
+            if self._skip_confirm_check.isChecked():
+                self.db.set_setting('skip_exit_confirm', '1')
+            self._close_database()
             event.accept()
         else:
             event.ignore()
+
+    def _close_database(self):
+        """Close database connection"""
+        try:
+            self.db.close()
+        except Exception:
+            log.exception("Error closing database connection")
@@ -0,0 +1,6 @@
+"""
+Qt item models shared between GUI tabs
+"""
+from .inventory_model import InventoryModel, prime_cost
+
+__all__ = ["InventoryModel", "prime_cost"]
@@ -0,0 +1,280 @@
+"""
+Inventory Model - Inventory rows shared by the inventory and draft listing tabs
+"""
+import logging
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from ..value_helpers import resolve_cost, format_currency
+from ..workers import DatabaseWorker
+
+log = logging.getLogger(__name__)
+
+
+def prime_cost(item):
+    """Store the resolved cost on ``item`` so repaints don't recompute it.
+
+    ``resolve_cost`` checks several legacy keys; the result is kept under
+    ``_cost`` (float or ``None``) and ``_cost_str`` (formatted text).
+    """
+    if '_cost' not in item:
+        item['_cost'] = resolve_cost(item)
+        item['_cost_str'] = format_currency(item['_cost'])
+    return item
+
+
+class InventoryModel(QAbstractTableModel):
+    """Table model exposing inventory records to a ``QTableView``.
+
+    Unlike ``QTableWidget`` no per-cell item objects are created up front;
+    the view asks for the text of the cells it is actually painting.
+
+    One instance is shared by every tab that lists inventory, so a single
+    :meth:`refresh` queries the database once and updates all their views.
+    """
+
+    # Emitted after refresh() replaced the rows, or with the error message
+    loaded = pyqtSignal()
+    loadFailed = pyqtSignal(str)
+
+    HEADERS = [
+        "ID", "Title", "Category", "SKU", "Brand/Model", "Condition",
+        "Purchase Cost", "Listed Price", "Status", "Location", "Notes", "Actions"
+    ]
+    ACTIONS_COLUMN = 11
+    # Custom roles read by ActionsDelegate.
+    ITEM_ID_ROLE = Qt.ItemDataRole.UserRole
+    ACTIONS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    # Rows requested from the database per fetchMore() call.
+    PAGE_SIZE = 200
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.items = []
+        # Loaded rows keyed by id, so dialogs can reuse them without a query
+        self._by_id = {}
+        # Ids of rows whose display failed; each is logged only once, since
+        # data() runs on every repaint
+        self._bad_rows = set()
+        self._fetch_page = None
+        self._has_more = False
+        self.page_size = self.PAGE_SIZE
+        # Signals of the refresh() worker whose result is still wanted
+        self._loader = None
+        # db.revision the rows were loaded at (None until the first load)
+        self._loaded_revision = None
+        self._pending_revision = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            try:
+                return self._display_text(item, index.column())
+            except Exception:
+                item_id = item.get('id')
+                if item_id not in self._bad_rows:
+                    self._bad_rows.add(item_id)
+                    log.exception("Error displaying inventory item %s", item_id)
+                return ""
+        if role == self.ITEM_ID_ROLE:
+            return item['id']
+        if role == self.ACTIONS_ROLE:
+            # Mark as Sold is only offered for In Stock and Listed items
+            if item.get('status') in ['In Stock', 'Listed', None]:
+                return ("view", "edit", "sold")
+            return ("view", "edit")
+        return None
+
+    @staticmethod
+    def _display_text(item, column):
+        """Return the text shown for ``item`` in ``column``."""
+        if column == 0:
+            return str(item['id'])
+        if column == 1:
+            return item.get('title') or ''
+        if column == 2:
+            return item.get('category') or ''
+        if column == 3:
+            return item.get('sku') or ''
+        if column == 4:
+            return f"{item.get('brand') or ''} {item.get('model') or ''}".strip()
+        if column == 5:
+            return item.get('condition') or ''
+        if column == 6:
+            return item['_cost_str']
+        if column == 7:
+            # Listed Price (not start_price)
+            listed_price = item.get('listed_price')
+            return format_currency(listed_price) if listed_price else "N/A"
+        if column == 8:
+            return item.get('status') or 'In Stock'
+        if column == 9:
+            return item.get('location') or ''
+        if column == 10:
+            return item.get('notes') or ''
+        return None
+
+    @property
+    def is_loaded(self):
+        """``True`` once a refresh has been started."""
+        return self._loader is not None or self._loaded_revision is not None
+
+    def refresh(self):
+        """Reload the first page from the database on a worker thread.
+
+        Every status is loaded; views filter the rows with a proxy model.
+        ``loaded`` or ``loadFailed`` is emitted when the query finishes.
+        """
+        page_size = self.PAGE_SIZE
+        worker = DatabaseWorker(
+            self.db, lambda db: db.get_inventory_items(limit=page_size, offset=0)
+        )
+        worker.signals.finished.connect(self._on_loaded)
+        worker.signals.failed.connect(self._on_failed)
+        # Replacing _loader makes any older, still-running load stale
+        self._loader = worker.signals
+        self._pending_revision = self.db.revision
+        worker.start()
+
+    def refresh_if_stale(self):
+        """Call :meth:`refresh` unless the rows match the database already.
+
+        Returns ``True`` when a reload was started.  Tabs call this when they
+        are shown, so switching between tabs sharing the model only queries
+        the database once per change.
+        """
+        if self._loader is not None or self._loaded_revision == self.db.revision:
+            return False
+        self.refresh()
+        return True
+
+    def _is_current_load(self):
+        return self._loader is not None and self.sender() is self._loader
+
+    def _on_loaded(self, first_page):
+        if not self._is_current_load():
+            return
+        self._loader = None
+        try:
+            # Later pages are small and fetched on demand while scrolling
+            def fetch_page(offset, limit):
+                return self.db.get_inventory_items(limit=limit, offset=offset)
+
+            self.set_source(fetch_page, first_page=first_page)
+        except Exception as e:
+            self.loadFailed.emit(str(e))
+            return
+        self._loaded_revision = self._pending_revision
+        self.loaded.emit()
+
+    def _on_failed(self, message):
+        if not self._is_current_load():
+            return
+        self._loader = None
+        self.loadFailed.emit(message)
+
+    def set_items(self, items):
+        """Replace every row with ``items``."""
+        self.beginResetModel()
+        self.items = [prime_cost(item) for item in items]
+        self._by_id = {item['id']: item for item in self.items}
+        self._bad_rows.clear()
+        self._fetch_page = None
+        self._has_more = False
+        self.endResetModel()
+
+    def set_source(self, fetch_page, page_size=None, first_page=None):
+        """Load rows lazily from ``fetch_page(offset, limit)``.
+
+        Only the first page is fetched here (or taken from ``first_page``
+        when the caller already loaded it); the view pulls further pages
+        through ``fetchMore`` as the user scrolls towards the end.
+        """
+        self.page_size = page_size or self.PAGE_SIZE
+        if first_page is None:
+            first_page = fetch_page(0, self.page_size)
+        first_page = [prime_cost(item) for item in first_page]
+        self.beginResetModel()
+        self.items = first_page
+        self._by_id = {item['id']: item for item in first_page}
+        self._bad_rows.clear()
+        self._fetch_page = fetch_page
+        self._has_more = len(first_page) >= self.page_size
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        rows = [prime_cost(item)
+                for item in self._fetch_page(len(self.items), self.page_size)]
+        self._has_more = len(rows) >= self.page_size
+        if not rows:
+            return
+        first = len(self.items)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.items.extend(rows)
+        self._by_id.update((item['id'], item) for item in rows)
+        self.endInsertRows()
+
+    def item_at(self, row):
+        """Return the item displayed in ``row`` or ``None``."""
+        if 0 <= row < len(self.items):
+            return self.items[row]
+        return None
+
+    def get_item(self, item_id):
+        """Return the loaded item with ``item_id`` or ``None``."""
+        return self._by_id.get(item_id)
+
+    def row_of(self, item_id):
+        """Return the row holding ``item_id`` or -1 when it is not loaded."""
+        for row, item in enumerate(self.items):
+            if item['id'] == item_id:
+                return row
+        return -1
+
+    def insert_item(self, item, row=0):
+        """Insert ``item`` at ``row`` (newest items sort first)."""
+        row = max(0, min(row, len(self.items)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.insert(row, prime_cost(item))
+        self._by_id[item['id']] = item
+        self.endInsertRows()
+
+    def update_item(self, item):
+        """Replace the loaded row for ``item['id']`` and repaint only it."""
+        row = self.row_of(item['id'])
+        if row < 0:
+            return
+        self.items[row] = self._by_id[item['id']] = prime_cost(item)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def remove_item(self, item_id):
+        """Drop the row for ``item_id`` if it is loaded."""
+        row = self.row_of(item_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.items[row]
+        self._by_id.pop(item_id, None)
+        self.endRemoveRows()
@@ -3,16 +3,94 @@ Pricing Tab - Calculate optimal prices and compare shipping strategies
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QComboBox, QDoubleSpinBox, QGroupBox,
-                             QFormLayout, QTextEdit, QMessageBox, QSpinBox,
-                             QRadioButton, QButtonGroup)
-from PyQt6.QtCore import Qt
-import math
+                             QFormLayout, QMessageBox, QSpinBox,
+                             QRadioButton, QButtonGroup, QFrame, QGridLayout)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+import bisect
+from fractions import Fraction
+
+
+# Simplified USPS Priority Mail estimates: _SHIPPING_RATES[i] applies up to
+# _SHIPPING_MAX_LBS[i] billable pounds, the last rate to anything heavier.
+_SHIPPING_MAX_LBS = (1, 2, 3, 5, 10, 20)
+_SHIPPING_RATES = (8.00, 9.00, 10.50, 13.00, 17.00, 25.00, 35.00)
+
+def estimate_shipping_cost(weight, length, width, height):
+    """Estimate USPS Priority shipping for one package.
+
+    The billable weight is the larger of ``weight`` and the dimensional
+    weight (L x W x H / 166).  This is a plain function so bulk callers can
+    map it over many items without a PricingTab.
+    """
+    billable_weight = max(weight, (length * width * height) / 166)
+    # First bracket whose upper bound is at least the billable weight
+    return _SHIPPING_RATES[bisect.bisect_left(_SHIPPING_MAX_LBS, billable_weight)]
+
+
+def _price_cents(amount_cents, keep_ppm):
+    """Return the smallest price in cents that keeps ``amount_cents``.
+
+    ``keep_ppm`` is the share of the price left after percentage fees, in
+    parts per million; the division rounds up exactly.  ``amount_cents``
+    may be a ``Fraction`` when the target falls between cents.
+    """
+    return -(-amount_cents * 1_000_000 // keep_ppm)
+
+
+# Styles of the results panel.  The labels are built once in init_ui and
+# each calculation only changes their text.
+_SUMMARY_QSS = "font-size: 14px; font-weight: bold; color: #333;"
+_MUTED_QSS = "color: #666;"
+_NOTE_QSS = "font-size: 12px; color: #666;"
+_PROS_CONS_QSS = "color: #555;"
+_OPTION_FRAME_QSS = """
+    QFrame#{name} {{
+        background-color: {background};
+        border-radius: 8px;
+    }}
+"""
+_OPTION_TITLE_QSS = "font-size: 14px; font-weight: bold; color: {color};"
+_LIST_PRICE_QSS = "font-size: 20px; font-weight: bold; color: {color};"
+_NET_PROFIT_QSS = "font-size: 18px; font-weight: bold; color: green;"
+
+# (suffix, title, accent colour, background, shipping caption, pros, cons)
+_OPTIONS = (
+    ("a", "✅ OPTION A: FREE SHIPPING", "#1976D2", "#E3F2FD",
+     "Shipping (absorbed):",
+     "Better eBay search ranking, simpler for buyers", "Higher list price"),
+    ("b", "📦 OPTION B: CALCULATED SHIPPING", "#F57C00", "#FFF3E0",
+     "Buyer Pays Shipping:",
+     "Lower list price, transparent costs", "Buyers may prefer free shipping"),
+)
 
 
 class PricingTab(QWidget):
+    # Quiet period after an input change before prices are recalculated,
+    # in milliseconds
+    RECALC_DEBOUNCE_MS = 120
+    # Item combo role holding the inventory id of each entry
+    ITEM_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
     def __init__(self, db):
         super().__init__()
         self.db = db
+        # Coalesces bursts of input changes (typing a cost, holding a spin
+        # box arrow) into a single recalculation.
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(self.RECALC_DEBOUNCE_MS)
+        self._recalc_timer.timeout.connect(self._do_calculate_prices)
+        # Fee rates from the settings table, re-read only after the
+        # database changes (see _ensure_fee_cache)
+        self._fee_revision = None
+        self.refresh_fee_cache()
+        # Inputs of the last calculation
+        self._last_inputs = None
+        # (label texts, recommendation) currently displayed
+        self._last_results = None
+        # Value labels of the results panel keyed by field name
+        self._result_labels = {}
         self.init_ui()
     
     def init_ui(self):
@@ -130,10 +208,15 @@ class PricingTab(QWidget):
         results_group = QGroupBox("Pricing Comparison")
         results_layout = QVBoxLayout()
         
-        self.results_display = QTextEdit()
-        self.results_display.setReadOnly(True)
-        self.results_display.setMinimumHeight(400)
-        results_layout.addWidget(self.results_display)
+        # Shown instead of the comparison when prices can't be calculated
+        self.results_message = QLabel()
+        self.results_message.setWordWrap(True)
+        self.results_message.hide()
+        results_layout.addWidget(self.results_message)
+        
+        self.results_panel = self._build_results_panel()
+        self.results_panel.setMinimumHeight(400)
+        results_layout.addWidget(self.results_panel)
         
         # Recommendation label
         self.recommendation_label = QLabel()
@@ -152,38 +235,129 @@ class PricingTab(QWidget):
         layout.addLayout(main_layout)
         
         # Initial calculation
-        self.calculate_prices()
+        self._do_calculate_prices()
     
+    def _result_label(self, name, qss=None):
+        """Create the label that displays result field ``name``"""
+        label = QLabel()
+        if qss:
+            label.setStyleSheet(qss)
+        self._result_labels[name] = label
+        return label
+
+    def _build_results_panel(self):
+        """Build the fixed labels the pricing comparison is shown in"""
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        layout.addWidget(self._result_label('summary', _SUMMARY_QSS))
+        layout.addWidget(self._result_label('shipping_note', _MUTED_QSS))
+        
+        for suffix, title, color, background, shipping_caption, pros, cons in _OPTIONS:
+            frame = QFrame()
+            frame.setObjectName(f"option_{suffix}")
+            frame.setStyleSheet(_OPTION_FRAME_QSS.format(name=frame.objectName(),
+                                                         background=background))
+            frame_layout = QVBoxLayout(frame)
+            frame_layout.setContentsMargins(15, 15, 15, 15)
+            
+            title_label = QLabel(title)
+            title_label.setStyleSheet(_OPTION_TITLE_QSS.format(color=color))
+            frame_layout.addWidget(title_label)
+            
+            grid = QGridLayout()
+            rows = (
+                (QLabel("<b>List Price:</b>"),
+                 self._result_label(f'price_{suffix}', _LIST_PRICE_QSS.format(color=color))),
+                (QLabel(shipping_caption), self._result_label(f'shipping_{suffix}')),
+                (self._result_label(f'ebay_caption_{suffix}'),
+                 self._result_label(f'ebay_fee_{suffix}')),
+                (self._result_label(f'payment_caption_{suffix}'),
+                 self._result_label(f'payment_fee_{suffix}')),
+                (QLabel("Your Cost:"), self._result_label(f'cost_{suffix}')),
+                (QLabel("<b>Net Profit:</b>"),
+                 self._result_label(f'net_profit_{suffix}', _NET_PROFIT_QSS)),
+            )
+            for row, (caption, value) in enumerate(rows):
+                value.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                grid.addWidget(caption, row, 0)
+                grid.addWidget(value, row, 1)
+            frame_layout.addLayout(grid)
+            
+            pros_cons = QLabel(f"<b>Pros:</b> {pros}<br><b>Cons:</b> {cons}")
+            pros_cons.setStyleSheet(_PROS_CONS_QSS)
+            frame_layout.addWidget(pros_cons)
+            layout.addWidget(frame)
+        
+        note = QLabel(
+            "<b>Note:</b> Shipping cost is estimated. Actual cost varies by destination. "
+            "eBay fees shown are standard rates and may vary by category."
+        )
+        note.setWordWrap(True)
+        note.setStyleSheet(_NOTE_QSS)
+        layout.addWidget(note)
+        layout.addStretch()
+        return panel
+
+    def _show_results_message(self, message):
+        """Replace the comparison with ``message``"""
+        self._last_results = None
+        self.results_panel.hide()
+        self.results_message.setText(message)
+        self.results_message.show()
+
     def load_inventory_items(self):
         """Load inventory items into dropdown"""
-        self.item_combo.clear()  # Clear existing items first!
-        self.item_combo.addItem("Select an item...", None)  # Add placeholder
-        items = self.db.get_inventory_items(status='In Stock')
-        for item in items:
-            # Convert Row to dict and get cost
-            if not isinstance(item, dict):
-                item = dict(item)
-            cost = item.get('cost') or item.get('purchase_price') or 0
-            title = item.get('title', 'Untitled')[:40]
-            display_text = f"{title} (${cost:.2f})"
-            self.item_combo.addItem(display_text, item)
+        # The selected item is kept across reloads by id, so it survives
+        # rows being added or reordered.
+        selected = self.item_combo.currentData()
+        # Repopulating moves the current index around; nothing is selected
+        # by it, so on_item_selected isn't signalled once per entry.
+        was_blocked = self.item_combo.blockSignals(True)
+        try:
+            entries = [QStandardItem("Select an item...")]  # Placeholder
+            # (id, title, cost, weight_lbs, length_in, width_in, height_in)
+            # tuples; the whole tuple is kept as the entry's data.
+            for row in self.db.get_inventory_pricing_rows(status='In Stock'):
+                entry = QStandardItem(f"{(row[1] or 'Untitled')[:40]} (${row[2]:.2f})")
+                entry.setData(row, Qt.ItemDataRole.UserRole)
+                entry.setData(row[0], self.ITEM_ID_ROLE)
+                entries.append(entry)
+            # The entries go into a fresh model in one call instead of an
+            # addItem round trip each; the combo deletes the model it owned.
+            model = QStandardItemModel(self.item_combo)
+            model.appendColumn(entries)
+            self.item_combo.setModel(model)
+            if selected:
+                index = self.item_combo.findData(selected[0], self.ITEM_ID_ROLE)
+                self.item_combo.setCurrentIndex(max(index, 0))
+        finally:
+            self.item_combo.blockSignals(was_blocked)
     
     def on_item_selected(self):
         """Handle inventory item selection"""
         item_data = self.item_combo.currentData()
         if item_data:
-            cost = item_data.get('cost') or item_data.get('purchase_price') or 0
-            self.cost_input.setValue(cost)
-            # Use explicit None checks to allow 0 as a valid value
-            if item_data.get('weight_lbs') is not None:
-                self.weight_input.setValue(float(item_data.get('weight_lbs')))
-            if item_data.get('length_in') is not None:
-                self.length_input.setValue(int(item_data.get('length_in')))
-            if item_data.get('width_in') is not None:
-                self.width_input.setValue(int(item_data.get('width_in')))
-            if item_data.get('height_in') is not None:
-                self.height_input.setValue(int(item_data.get('height_in')))
-            self.calculate_prices()
+            _item_id, _title, cost, weight, length, width, height = item_data
+            inputs = (
+                (self.cost_input, cost, float),
+                (self.weight_input, weight, float),
+                (self.length_input, length, int),
+                (self.width_input, width, int),
+                (self.height_input, height, int),
+            )
+            # Fill every input first and calculate once, rather than have
+            # each setValue signal its own recalculation.
+            for widget, value, convert in inputs:
+                # Use explicit None checks to allow 0 as a valid value
+                if value is not None:
+                    was_blocked = widget.blockSignals(True)
+                    try:
+                        widget.setValue(convert(value))
+                    finally:
+                        widget.blockSignals(was_blocked)
+            self._do_calculate_prices()
     
     def on_profit_type_changed(self):
         """Handle profit type change"""
@@ -197,8 +371,16 @@ class PricingTab(QWidget):
             self.profit_input.setValue(30.00)
         self.calculate_prices()
 
-    def _get_fee_setting(self, key, default):
-        value = self.db.get_setting(key)
+    # Fee setting keys and the rates used when a key is unset or invalid
+    FEE_DEFAULTS = {
+        'ebay_fee_percent': 0.129,
+        'ebay_fee_fixed': 0.30,
+        'payment_fee_percent': 0.029,
+        'payment_fee_fixed': 0.30,
+    }
+
+    @staticmethod
+    def _fee_value(value, default):
         if value in (None, ""):
             return default
         try:
@@ -206,85 +388,114 @@ class PricingTab(QWidget):
         except (TypeError, ValueError):
             return default
 
+    def refresh_fee_cache(self):
+        """Re-read the four fee settings into their cached attributes"""
+        stored = self.db.get_settings_bulk(self.FEE_DEFAULTS)
+        fees = {key: self._fee_value(stored.get(key), default)
+                for key, default in self.FEE_DEFAULTS.items()}
+        self._ebay_percent = fees['ebay_fee_percent']
+        self._ebay_fixed = fees['ebay_fee_fixed']
+        self._payment_percent = fees['payment_fee_percent']
+        self._payment_fixed = fees['payment_fee_fixed']
+        self._fee_revision = self.db.revision
+
+    def _ensure_fee_cache(self):
+        # Saving settings writes to the database, which changes its
+        # revision; until then the cached rates are current.
+        if self._fee_revision != self.db.revision:
+            self.refresh_fee_cache()
+
     def calculate_shipping_cost(self, weight, length, width, height):
         """
         Estimate shipping cost using simplified USPS rates
         This is a rough estimate - actual costs vary by destination
         """
-        # Calculate dimensional weight
-        dim_weight = (length * width * height) / 166
-        billable_weight = max(weight, dim_weight)
-        
-        # Simplified USPS Priority Mail estimates
-        if billable_weight <= 1:
-            return 8.00
-        elif billable_weight <= 2:
-            return 9.00
-        elif billable_weight <= 3:
-            return 10.50
-        elif billable_weight <= 5:
-            return 13.00
-        elif billable_weight <= 10:
-            return 17.00
-        elif billable_weight <= 20:
-            return 25.00
-        else:
-            return 35.00
+        return estimate_shipping_cost(weight, length, width, height)
     
     def calculate_ebay_fee(self, price):
         """Calculate eBay final value fee"""
-        percent = self._get_fee_setting('ebay_fee_percent', 0.129)
-        fixed = self._get_fee_setting('ebay_fee_fixed', 0.30)
-        return (price * percent) + fixed
+        self._ensure_fee_cache()
+        return (price * self._ebay_percent) + self._ebay_fixed
 
     def calculate_payment_fee(self, price):
         """Calculate payment processing fee"""
-        percent = self._get_fee_setting('payment_fee_percent', 0.029)
-        fixed = self._get_fee_setting('payment_fee_fixed', 0.30)
-        return (price * percent) + fixed
+        self._ensure_fee_cache()
+        return (price * self._payment_percent) + self._payment_fixed
     
     def calculate_prices(self):
+        """Schedule a recalculation once the inputs stop changing"""
+        self._recalc_timer.start()
+
+    def _do_calculate_prices(self):
         """Calculate and display pricing options"""
+        self._recalc_timer.stop()
         cost = self.cost_input.value()
+        dollar_profit = self.profit_dollar_radio.isChecked()
+        profit_value = self.profit_input.value()
+        weight = self.weight_input.value()
+        length = self.length_input.value()
+        width = self.width_input.value()
+        height = self.height_input.value()
+        self._ensure_fee_cache()
+        ebay_percent = self._ebay_percent
+        ebay_fixed = self._ebay_fixed
+        payment_percent = self._payment_percent
+        payment_fixed = self._payment_fixed
+        
+        # Signals that don't change any input (e.g. picking another
+        # category, which all share the same fee) leave the results as is.
+        inputs = (cost, dollar_profit, profit_value, weight, length, width, height,
+                  ebay_percent, ebay_fixed, payment_percent, payment_fixed)
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = inputs
+        
         if cost == 0:
-            self.results_display.setText("Please enter a cost basis to calculate prices.")
+            self._show_results_message("Please enter a cost basis to calculate prices.")
             return
         
         # Get target profit
-        if self.profit_dollar_radio.isChecked():
-            target_profit = self.profit_input.value()
+        if dollar_profit:
+            target_profit = profit_value
         else:
             # Convert percentage to dollar amount
-            target_profit = cost * (self.profit_input.value() / 100)
+            target_profit = cost * (profit_value / 100)
         
         # Get shipping cost
-        weight = self.weight_input.value()
-        length = self.length_input.value()
-        width = self.width_input.value()
-        height = self.height_input.value()
         shipping_cost = self.calculate_shipping_cost(weight, length, width, height)
 
-        ebay_percent = self._get_fee_setting('ebay_fee_percent', 0.129)
-        ebay_fixed = self._get_fee_setting('ebay_fee_fixed', 0.30)
-        payment_percent = self._get_fee_setting('payment_fee_percent', 0.029)
-        payment_fixed = self._get_fee_setting('payment_fee_fixed', 0.30)
-
         combined_percent = 1 - (ebay_percent + payment_percent)
         combined_fixed = ebay_fixed + payment_fixed
+        # List prices are solved in integer cents, with the share of the
+        # price kept after percentage fees in parts per million, so rounding
+        # up to the next cent is exact (a float 9.999999 is not bumped to
+        # 10.00 any more).
+        keep_ppm = round(combined_percent * 1_000_000)
 
-        if combined_percent <= 0:
-            self.results_display.setText(
+        if keep_ppm <= 0:
+            self._show_results_message(
                 "Fee settings result in a combined percentage of 100% or more. "
                 "Please adjust the fee rates in Settings."
             )
             self.recommendation_label.setText("")
             return
 
+        cost_c = round(cost * 100)
+        if dollar_profit:
+            target_profit_c = round(target_profit * 100)
+        else:
+            # A percent margin of the cost can fall between cents; keep it
+            # exact (both inputs have two decimals) so the solved price is
+            # the smallest one that still reaches the target.
+            target_profit_c = Fraction(cost_c * round(profit_value * 100), 10_000)
+        shipping_c = round(shipping_cost * 100)
+        combined_fixed_c = round(combined_fixed * 100)
+
         # Calculate Option A: Free Shipping (rolled into price)
         # price - shipping - ebay_fee - payment_fee - cost = target_profit
         # => price * (1 - ebay_percent - payment_percent) = target_profit + cost + shipping + combined_fixed
-        price_a = (target_profit + cost + shipping_cost + combined_fixed) / combined_percent
-        price_a = math.ceil(price_a * 100) / 100  # Round up to nearest cent
+        price_a = _price_cents(target_profit_c + cost_c + shipping_c + combined_fixed_c,
+                               keep_ppm) / 100
 
         ebay_fee_a = self.calculate_ebay_fee(price_a)
         payment_fee_a = self.calculate_payment_fee(price_a)
@@ -293,65 +504,35 @@ class PricingTab(QWidget):
         # Calculate Option B: Calculated Shipping (buyer pays)
         # Here: price - ebay_fee - payment_fee - cost = target_profit
         # => price * (1 - ebay_percent - payment_percent) = target_profit + cost + combined_fixed
-        price_b = (target_profit + cost + combined_fixed) / combined_percent
-        price_b = math.ceil(price_b * 100) / 100
+        price_b = _price_cents(target_profit_c + cost_c + combined_fixed_c, keep_ppm) / 100
 
         ebay_fee_b = self.calculate_ebay_fee(price_b)
         payment_fee_b = self.calculate_payment_fee(price_b)
         net_profit_b = price_b - ebay_fee_b - payment_fee_b - cost
         
         # Display results
-        results_html = f"""
-        <html>
-        <body style="font-family: Arial; font-size: 13px;">
-        <h3 style="color: #333;">Item Cost: ${cost:.2f} | Target Profit: ${target_profit:.2f}</h3>
-        <p style="color: #666;">Estimated Shipping: ${shipping_cost:.2f} (USPS Priority)</p>
-        
-        <hr>
-        
-        <div style="background-color: #E3F2FD; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
-        <h3 style="color: #1976D2; margin-top: 0;">✅ OPTION A: FREE SHIPPING</h3>
-        <table style="width: 100%;">
-        <tr><td><b>List Price:</b></td><td style="text-align: right; font-size: 20px; color: #1976D2;"><b>${price_a:.2f}</b></td></tr>
-        <tr><td>Shipping (absorbed):</td><td style="text-align: right;">-${shipping_cost:.2f}</td></tr>
-        <tr><td>eBay Fee ({ebay_percent*100:.2f}% + ${ebay_fixed:.2f}):</td><td style="text-align: right;">-${ebay_fee_a:.2f}</td></tr>
-        <tr><td>Payment Fee ({payment_percent*100:.2f}% + ${payment_fixed:.2f}):</td><td style="text-align: right;">-${payment_fee_a:.2f}</td></tr>
-        <tr><td>Your Cost:</td><td style="text-align: right;">-${cost:.2f}</td></tr>
-        <tr style="border-top: 2px solid #1976D2;"><td><b>Net Profit:</b></td><td style="text-align: right; color: green; font-size: 18px;"><b>${net_profit_a:.2f}</b></td></tr>
-        </table>
-        <p style="margin-top: 10px; color: #555;">
-        <b>Pros:</b> Better eBay search ranking, simpler for buyers<br>
-        <b>Cons:</b> Higher list price
-        </p>
-        </div>
-        
-        <div style="background-color: #FFF3E0; padding: 15px; border-radius: 8px;">
-        <h3 style="color: #F57C00; margin-top: 0;">📦 OPTION B: CALCULATED SHIPPING</h3>
-        <table style="width: 100%;">
-        <tr><td><b>List Price:</b></td><td style="text-align: right; font-size: 20px; color: #F57C00;"><b>${price_b:.2f}</b></td></tr>
-        <tr><td>Buyer Pays Shipping:</td><td style="text-align: right;">+${shipping_cost:.2f}</td></tr>
-        <tr><td>eBay Fee ({ebay_percent*100:.2f}% + ${ebay_fixed:.2f}):</td><td style="text-align: right;">-${ebay_fee_b:.2f}</td></tr>
-        <tr><td>Payment Fee ({payment_percent*100:.2f}% + ${payment_fixed:.2f}):</td><td style="text-align: right;">-${payment_fee_b:.2f}</td></tr>
-        <tr><td>Your Cost:</td><td style="text-align: right;">-${cost:.2f}</td></tr>
-        <tr style="border-top: 2px solid #F57C00;"><td><b>Net Profit:</b></td><td style="text-align: right; color: green; font-size: 18px;"><b>${net_profit_b:.2f}</b></td></tr>
-        </table>
-        <p style="margin-top: 10px; color: #555;">
-        <b>Pros:</b> Lower list price, transparent costs<br>
-        <b>Cons:</b> Buyers may prefer free shipping
-        </p>
-        </div>
-        
-        <hr>
-        
-        <p style="font-size: 12px; color: #666; margin-top: 15px;">
-        <b>Note:</b> Shipping cost is estimated. Actual cost varies by destination.
-        eBay fees shown are standard rates and may vary by category.
-        </p>
-        </body>
-        </html>
-        """
-        
-        self.results_display.setHtml(results_html)
+        ebay_caption = f"eBay Fee ({ebay_percent*100:.2f}% + ${ebay_fixed:.2f}):"
+        payment_caption = f"Payment Fee ({payment_percent*100:.2f}% + ${payment_fixed:.2f}):"
+        fields = {
+            'summary': f"Item Cost: ${cost:.2f} | Target Profit: ${target_profit:.2f}",
+            'shipping_note': f"Estimated Shipping: ${shipping_cost:.2f} (USPS Priority)",
+            'price_a': f"${price_a:.2f}",
+            'shipping_a': f"-${shipping_cost:.2f}",
+            'ebay_caption_a': ebay_caption,
+            'ebay_fee_a': f"-${ebay_fee_a:.2f}",
+            'payment_caption_a': payment_caption,
+            'payment_fee_a': f"-${payment_fee_a:.2f}",
+            'cost_a': f"-${cost:.2f}",
+            'net_profit_a': f"${net_profit_a:.2f}",
+            'price_b': f"${price_b:.2f}",
+            'shipping_b': f"+${shipping_cost:.2f}",
+            'ebay_caption_b': ebay_caption,
+            'ebay_fee_b': f"-${ebay_fee_b:.2f}",
+            'payment_caption_b': payment_caption,
+            'payment_fee_b': f"-${payment_fee_b:.2f}",
+            'cost_b': f"-${cost:.2f}",
+            'net_profit_b': f"${net_profit_b:.2f}",
+        }
         
         # Recommendation
         if weight <= 1 and price_a < 50:
@@ -361,13 +542,22 @@ class PricingTab(QWidget):
         else:
             recommendation = f"🎯 <b>Recommendation: FREE SHIPPING</b><br>Free shipping generally provides better visibility and conversion on eBay."
         
+        # Skip relabelling when the numbers and recommendation shown are
+        # the same as last time.
+        results = (fields, recommendation)
+        if results == self._last_results:
+            return
+        previous = self._last_results[0] if self._last_results else {}
+        self._last_results = results
+        
+        for name, text in fields.items():
+            if previous.get(name) != text:
+                self._result_labels[name].setText(text)
+        self.results_message.hide()
+        self.results_panel.show()
         self.recommendation_label.setText(recommendation)
     
     def refresh_data(self):
         """Refresh the pricing tab (reload inventory items)"""
-        current_selection = self.item_combo.currentIndex()
-        self.item_combo.clear()
-        self.item_combo.addItem("-- Select from Inventory --", None)
+        # load_inventory_items restores the selection; the inputs are kept
         self.load_inventory_items()
-        if current_selection >= 0 and current_selection < self.item_combo.count():
-            self.item_combo.setCurrentIndex(current_selection)
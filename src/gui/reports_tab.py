@@ -3,26 +3,158 @@ from __future__ import annotations
 
 import os
 import csv
+import itertools
+import operator
 import datetime
 from typing import Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QFormLayout,
     QPushButton, QLabel, QLineEdit, QTextEdit, QCheckBox, QFileDialog,
     QMessageBox, QSizePolicy
 )
 
+from .workers import DatabaseWorker
+
+
+# Stylesheet for the whole tab, parsed once when init_ui sets it on the root;
+# buttons pick their colour through objectName "primary"/"secondary"
+_TAB_QSS = (
+    "QGroupBox{font-size:13px;margin-top:6px;}QGroupBox::title{left:6px;padding:2px 4px;}"
+    "QPushButton#primary, QPushButton#secondary {"
+    "  color: white; padding: 8px 10px;"
+    "  border: none; border-radius: 4px; font-size: 14px;}"
+    "QPushButton#primary { background-color: #1976D2; }"
+    "QPushButton#primary:hover { background-color: #1565C0; }"
+    "QPushButton#primary:pressed { background-color: #0D47A1; }"
+    "QPushButton#secondary { background-color: #4CAF50; }"
+    "QPushButton#secondary:hover { background-color: #43A047; }"
+    "QPushButton#secondary:pressed { background-color: #2E7D32; }"
+)
+
+# Keys Database adds to rows that have a cost (see Database._add_cost_aliases)
+_COST_ALIASES = ("purchase_cost", "cost", "purchase_price")
+
+# Write buffer for CSV exports; large exports hit the disk in 1 MiB writes
+_CSV_BUFSIZE = 1 << 20
+
+
+def _write_csv(path: str, keys, rows) -> int:
+    """Write a header of ``keys`` and one line per row mapping to ``path``.
+
+    Rows are written as plain value tuples in ``keys`` order; keys a row
+    lacks are left blank.  Returns the number of rows written.
+    """
+    keys = list(keys)
+    getter = operator.itemgetter(*keys)
+    single = len(keys) == 1
+
+    def values(r):
+        # itemgetter reads every column in one C call; only rows missing a
+        # key (e.g. without the purchase_cost alias) take the slow path.
+        try:
+            v = getter(r)
+        except KeyError:
+            return tuple(r.get(k, "") for k in keys)
+        return (v,) if single else v
+
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFSIZE) as f:
+        w = csv.writer(f)
+        w.writerow(keys)
+        writerow = w.writerow
+        for count, r in enumerate(rows, 1):
+            writerow(values(r))
+    return count
+
+
+def _export_rows(rows, path: str) -> int:
+    """Stream ``rows`` to ``path`` with the first row's keys as header.
+
+    The cost aliases are added to the header whenever the rows carry cost
+    columns, since the first row may lack ``purchase_cost`` while later
+    rows have it; missing values are written blank.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    keys = dict.fromkeys(first)
+    if not keys.keys().isdisjoint(_COST_ALIASES):
+        keys.update(dict.fromkeys(_COST_ALIASES))
+    return _write_csv(path, keys, itertools.chain((first,), rows))
+
+
+def _export_raw_rows(result, path: str) -> int:
+    """Write a ``(columns, tuple rows)`` result straight to ``path``."""
+    columns, rows = result
+    first = next(rows, None)
+    if first is None:
+        return 0
+    count = 1
+    with open(path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFSIZE) as f:
+        w = csv.writer(f)
+        w.writerow(columns)
+        writerow = w.writerow
+        writerow(first)
+        for row in rows:
+            writerow(row)
+            count += 1
+    return count
+
+
+def _export_custom_rows(db, path: str) -> int:
+    """Write inventory and expense rows to one CSV with the union of keys.
+
+    Columns follow the inventory, then the expense schema.  Rows of one
+    query share their columns, so each source's first row gives its keys;
+    the cost aliases some rows gain are declared up front.  The rows are
+    streamed in a single pass.
+    """
+    keys, streams = {}, []
+    for name in ("iter_inventory_items", "iter_expenses"):
+        if not hasattr(db, name):
+            continue
+        rows = getattr(db, name)()
+        first = next(rows, None)
+        if first is None:
+            continue
+        keys.update(dict.fromkeys(first))
+        if not keys.keys().isdisjoint(_COST_ALIASES):
+            keys.update(dict.fromkeys(_COST_ALIASES))
+        streams.append(itertools.chain((first,), rows))
+    if not streams:
+        return 0
+    return _write_csv(path, keys, itertools.chain.from_iterable(streams))
+
 
 class ReportsTab(QWidget):
+    # Quiet period before load_analytics() re-reads the counts, in milliseconds
+    ANALYTICS_DEBOUNCE_MS = 250
+    # Lines kept in the export log; older ones are dropped
+    LOG_MAX_LINES = 500
+
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
+        # Signals of exports still running; the worker threads write the
+        # files so large exports don't freeze the window.
+        self._exports = set()
+        # (db.revision, inventory count, expense count); see _row_counts
+        self._counts_cache = None
+        # Folder of the last chosen export file; save dialogs start there
+        self._last_export_dir = self.db.get_setting("last_export_dir") or ""
+        self._analytics_timer = QTimer(self)
+        self._analytics_timer.setSingleShot(True)
+        self._analytics_timer.setInterval(self.ANALYTICS_DEBOUNCE_MS)
+        self._analytics_timer.timeout.connect(self._do_load_analytics)
         self.init_ui()
 
     # ------------------------------ UI
 
     def init_ui(self):
+        self.setStyleSheet(_TAB_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
 
@@ -47,39 +179,20 @@ class ReportsTab(QWidget):
         grid.addWidget(log_group,    1, 1)
 
         layout.addLayout(grid)
-        self.load_analytics()
-
-    def _btn_style(self) -> str:
-        return (
-            "QPushButton {"
-            "  background-color: #1976D2; color: white; padding: 8px 10px;"
-            "  border: none; border-radius: 4px; font-size: 14px;}"
-            "QPushButton:hover { background-color: #1565C0; }"
-            "QPushButton:pressed { background-color: #0D47A1; }"
-        )
-
-    def _secondary_btn_style(self) -> str:
-        return (
-            "QPushButton {"
-            "  background-color: #4CAF50; color: white; padding: 8px 10px;"
-            "  border: none; border-radius: 4px; font-size: 14px;}"
-            "QPushButton:hover { background-color: #43A047; }"
-            "QPushButton:pressed { background-color: #2E7D32; }"
-        )
+        self._do_load_analytics()
 
     # ------------------------------ Groups (left/right columns)
 
     def _build_quick_reports_group(self) -> QGroupBox:
         g = QGroupBox("Quick Reports")
-        g.setStyleSheet("QGroupBox{font-size:13px;margin-top:6px;}QGroupBox::title{left:6px;padding:2px 4px;}")
         v = QVBoxLayout(g); v.setContentsMargins(8,6,8,6); v.setSpacing(6)
 
         btn_inv = QPushButton("📦 Export Inventory Report")
-        btn_inv.setStyleSheet(self._btn_style())
+        btn_inv.setObjectName("primary")
         btn_inv.clicked.connect(self.export_inventory_report)
 
         btn_exp = QPushButton("💵 Export Expense Report")
-        btn_exp.setStyleSheet(self._btn_style())
+        btn_exp.setObjectName("primary")
         btn_exp.clicked.connect(self.export_expense_report)
 
         v.addWidget(btn_inv)
@@ -89,7 +202,6 @@ class ReportsTab(QWidget):
 
     def _build_business_analytics_group(self) -> QGroupBox:
         g = QGroupBox("Business Analytics")
-        g.setStyleSheet("QGroupBox{font-size:13px;margin-top:6px;}QGroupBox::title{left:6px;padding:2px 4px;}")
         v = QVBoxLayout(g); v.setContentsMargins(8,6,8,6); v.setSpacing(6)
         self.analytics_box = QTextEdit(); self.analytics_box.setReadOnly(True)
         self.analytics_box.setMinimumHeight(120)
@@ -98,12 +210,11 @@ class ReportsTab(QWidget):
 
     def _build_custom_export_group(self) -> QGroupBox:
         g = QGroupBox("Custom Export")
-        g.setStyleSheet("QGroupBox{font-size:13px;margin-top:6px;}QGroupBox::title{left:6px;padding:2px 4px;}")
         f = QFormLayout(g); f.setContentsMargins(8,6,8,6); f.setSpacing(6)
 
         self.custom_path_edit = QLineEdit()
         self.custom_path_edit.setPlaceholderText("Choose where to save the custom CSV…")
-        choose_btn = QPushButton("Browse…"); choose_btn.setStyleSheet(self._btn_style())
+        choose_btn = QPushButton("Browse…"); choose_btn.setObjectName("primary")
         choose_btn.clicked.connect(self._browse_custom_save)
 
         row = QWidget(); rowl = QHBoxLayout(row); rowl.setContentsMargins(0,0,0,0); rowl.setSpacing(6)
@@ -111,16 +222,16 @@ class ReportsTab(QWidget):
         f.addRow("Output file:", row)
 
         export_btn = QPushButton("📥 Export Custom Data")
-        export_btn.setStyleSheet(self._secondary_btn_style())
+        export_btn.setObjectName("secondary")
         export_btn.clicked.connect(self.export_custom)
         f.addRow("", export_btn)
         return g
 
     def _build_export_log_group(self) -> QGroupBox:
         g = QGroupBox("Export Log")
-        g.setStyleSheet("QGroupBox{font-size:13px;margin-top:6px;}QGroupBox::title{left:6px;padding:2px 4px;}")
         v = QVBoxLayout(g); v.setContentsMargins(8,6,8,6); v.setSpacing(6)
         self.log_view = QTextEdit(); self.log_view.setReadOnly(True); self.log_view.setMinimumHeight(100)
+        self.log_view.document().setMaximumBlockCount(self.LOG_MAX_LINES)
         v.addWidget(self.log_view)
         return g
 
@@ -132,43 +243,72 @@ class ReportsTab(QWidget):
         except Exception:
             pass
 
+    def _ask_save_path(self, title: str, filename: str) -> str:
+        """Ask for a CSV path, starting in and remembering the last export folder."""
+        start = os.path.join(self._last_export_dir, filename) if self._last_export_dir else filename
+        path, _ = QFileDialog.getSaveFileName(self, title, start, "CSV Files (*.csv)")
+        if path:
+            folder = os.path.dirname(path)
+            if folder != self._last_export_dir:
+                self._last_export_dir = folder
+                self.db.set_setting("last_export_dir", folder)
+        return path
+
+    def _start_export(self, job, log_msg: str, done_msg: str):
+        """Run ``job(db)`` on a worker, then log and announce the file it wrote.
+
+        ``job`` returns the number of rows written; 0 means there was
+        nothing to export and no file was written.
+        """
+        worker = DatabaseWorker(self.db, job)
+        signals = worker.signals
+        self._exports.add(signals)
+
+        def finished(count):
+            self._exports.discard(signals)
+            if not count:
+                QMessageBox.information(self, "No Data", "Nothing to export.")
+                return
+            self.log(log_msg)
+            QMessageBox.information(self, "Exported", done_msg)
+
+        def failed(message):
+            self._exports.discard(signals)
+            QMessageBox.critical(self, "Export failed", message)
+
+        signals.finished.connect(finished)
+        signals.failed.connect(failed)
+        worker.start()
+
     # Quick reports
     def export_inventory_report(self):
         try:
-            items = self.db.get_inventory_items() if hasattr(self.db, "get_inventory_items") else []
-            if not items:
+            if not self._row_counts()[0]:
                 QMessageBox.information(self, "No Data", "No inventory items found.")
                 return
-            path, _ = QFileDialog.getSaveFileName(self, "Save Inventory Report", "inventory_report.csv", "CSV Files (*.csv)")
+            path = self._ask_save_path("Save Inventory Report", "inventory_report.csv")
             if not path: return
-            keys = [k for k in items[0].keys()]
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.DictWriter(f, fieldnames=keys); w.writeheader()
-                for r in items: w.writerow(dict(r))
-            self.log(f"Inventory report exported to: {path}")
-            QMessageBox.information(self, "Exported", f"Inventory report saved to:\n{path}")
+            self._start_export(lambda db: _export_rows(db.iter_inventory_items(), path),
+                               f"Inventory report exported to: {path}",
+                               f"Inventory report saved to:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export failed", str(e))
 
     def export_expense_report(self):
         try:
-            rows = self.db.get_expenses() if hasattr(self.db, "get_expenses") else []
-            if not rows:
+            if not self._row_counts()[1]:
                 QMessageBox.information(self, "No Data", "No expenses found."); return
-            path, _ = QFileDialog.getSaveFileName(self, "Save Expense Report", "expense_report.csv", "CSV Files (*.csv)")
+            path = self._ask_save_path("Save Expense Report", "expense_report.csv")
             if not path: return
-            keys = [k for k in rows[0].keys()]
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.DictWriter(f, fieldnames=keys); w.writeheader()
-                for r in rows: w.writerow(dict(r))
-            self.log(f"Expense report exported to: {path}")
-            QMessageBox.information(self, "Exported", f"Expense report saved to:\n{path}")
+            self._start_export(lambda db: _export_raw_rows(db.get_expenses_raw(), path),
+                               f"Expense report exported to: {path}",
+                               f"Expense report saved to:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export failed", str(e))
 
     # Custom export
     def _browse_custom_save(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Custom Export", "custom_export.csv", "CSV Files (*.csv)")
+        path = self._ask_save_path("Save Custom Export", "custom_export.csv")
         if path: self.custom_path_edit.setText(path)
 
     def export_custom(self):
@@ -177,27 +317,29 @@ class ReportsTab(QWidget):
             QMessageBox.warning(self, "Choose file", "Please choose an output file.")
             return
         try:
-            rows = []
-            if hasattr(self.db, "get_inventory_items"):
-                rows += [dict(r) for r in self.db.get_inventory_items()]
-            if hasattr(self.db, "get_expenses"):
-                rows += [dict(r) for r in self.db.get_expenses()]
-            if not rows:
-                QMessageBox.information(self, "No Data", "Nothing to export."); return
-            keys = sorted({k for r in rows for k in r.keys()})
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.DictWriter(f, fieldnames=keys); w.writeheader()
-                for r in rows: w.writerow(r)
-            self.log(f"Custom export saved to: {path}")
-            QMessageBox.information(self, "Exported", f"Custom export saved to:\n{path}")
+            self._start_export(lambda db: _export_custom_rows(db, path),
+                               f"Custom export saved to: {path}",
+                               f"Custom export saved to:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export failed", str(e))
 
     # Analytics
+    def _row_counts(self):
+        """Return ``(inventory count, expense count)``, re-counted only after writes."""
+        revision = self.db.revision
+        if self._counts_cache is None or self._counts_cache[0] != revision:
+            self._counts_cache = (revision, self.db.count_inventory_items(),
+                                  self.db.count_expenses())
+        return self._counts_cache[1:]
+
     def load_analytics(self):
+        """Schedule an analytics refresh once the calls stop arriving."""
+        self._analytics_timer.start()
+
+    def _do_load_analytics(self):
+        self._analytics_timer.stop()
         try:
-            inv_count = len(self.db.get_inventory_items()) if hasattr(self.db, "get_inventory_items") else 0
-            exp_count = len(self.db.get_expenses()) if hasattr(self.db, "get_expenses") else 0
+            inv_count, exp_count = self._row_counts()
             self.analytics_box.setPlainText(
                 f"Inventory items: {inv_count}\n"
                 f"Expense records: {exp_count}\n"
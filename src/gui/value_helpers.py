@@ -50,3 +50,18 @@ def format_currency(value: Optional[float], default: str = "N/A") -> str:
         return f"${float(value):.2f}"
     except (TypeError, ValueError):
         return default
+
+
+def parse_float(text: Any, default: Optional[float] = None) -> Optional[float]:
+    """Parse user-entered ``text`` as a float without raising.
+
+    Blank input returns ``default``; input that is not a number returns
+    ``None`` so callers can tell "empty" apart from "invalid".
+    """
+
+    if text is None or (isinstance(text, str) and not text.strip()):
+        return default
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,62 @@
+"""Run read-only database queries on ``QThreadPool`` worker threads."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by :class:`DatabaseWorker`.
+
+    ``QRunnable`` is not a ``QObject``, so the signals live on a helper
+    object.  They are delivered on the receiver's (GUI) thread.
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class DatabaseWorker(QRunnable):
+    """Call ``query(db)`` on a private reader connection off the UI thread.
+
+    The worker opens its own connection with ``db.open_reader()`` because
+    sqlite3 connections cannot be shared between threads.  In-memory
+    databases cannot be reopened, so for those :meth:`start` runs the query
+    inline on ``db``; callers get the same signals either way.
+
+    Once started, the thread pool owns and deletes the worker.  Callers keep
+    ``worker.signals`` instead, e.g. to recognise results of the latest run.
+    """
+
+    def __init__(self, db, query: Callable[[Any], Any]):
+        super().__init__()
+        self.db = db
+        self.query = query
+        self.signals = WorkerSignals()
+
+    def start(self):
+        """Queue the worker on the global thread pool."""
+        if self.db.is_in_memory:
+            self._execute(self.db)
+        else:
+            QThreadPool.globalInstance().start(self)
+
+    def run(self):
+        try:
+            reader = self.db.open_reader()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        try:
+            self._execute(reader)
+        finally:
+            reader.close()
+
+    def _execute(self, db):
+        try:
+            result = self.query(db)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
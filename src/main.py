@@ -5,6 +5,7 @@ A comprehensive business management tool for eBay resellers
 
 Main application entry point
 """
+import logging
 import sys
 import os
 
@@ -14,15 +15,20 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtGui import QIcon
 from database import Database
-from gui.main_window import MainWindow
+from gui.main_window import MainWindow, install_stylesheet
 
 
 def main():
     """Main application entry point"""
+    # Errors the GUI recovers from are logged to stderr; INFO/DEBUG
+    # messages are dropped without being formatted.
+    logging.basicConfig(level=logging.WARNING)
+
     # Create QApplication
     app = QApplication(sys.argv)
     app.setApplicationName("eBay Reseller Manager")
     app.setOrganizationName("eBay Reseller Tools")
+    install_stylesheet(app)
     
     try:
         # Initialize database
@@ -55,6 +55,16 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(items[0]['title'], 'Test Item')
         self.assertTrue(hasattr(items[0], 'get'))
 
+    def test_get_inventory_items_pages(self):
+        """limit/offset should page through items newest first."""
+        for n in range(5):
+            self.db.add_inventory_item({'title': f'Item {n}'})
+
+        first = self.db.get_inventory_items(limit=2)
+        rest = self.db.get_inventory_items(limit=10, offset=2)
+        self.assertEqual([i['title'] for i in first], ['Item 4', 'Item 3'])
+        self.assertEqual([i['title'] for i in rest], ['Item 2', 'Item 1', 'Item 0'])
+
     def test_update_mapping(self):
         """Mappings should be persisted and retrievable."""
         mapping = {'title': 'Title', 'sku': 'Custom label (SKU)'}
@@ -63,6 +73,23 @@ class TestDatabase(unittest.TestCase):
         for key, value in mapping.items():
             self.assertEqual(stored.get(key), value)
 
+    def test_get_mapping_returns_cached_copy(self):
+        """Cached mappings should track updates and resist caller mutation."""
+        self.db.update_mapping('orders', {'title': 'Item Title'})
+        first = self.db.get_mapping('orders')
+        first['title'] = 'Mutated'
+        self.assertEqual(self.db.get_mapping('orders')['title'], 'Item Title')
+
+        self.db.update_mapping('orders', {'title': 'Title'})
+        self.assertEqual(self.db.get_mapping('ORDERS')['title'], 'Title')
+
+    def test_get_mappings_batches_report_types(self):
+        """get_mappings should return every requested report type at once."""
+        self.db.update_mapping('orders', {'title': 'Item Title'})
+        mappings = self.db.get_mappings(['orders', 'active_listings'])
+        self.assertEqual(mappings['orders'], {'title': 'Item Title'})
+        self.assertEqual(mappings['active_listings'], {})
+
     def test_inventory_items_expose_purchase_cost(self):
         """Inventory helpers should always expose a purchase_cost alias."""
         item_id = self.db.add_inventory_item({
@@ -130,6 +157,103 @@ class TestDatabase(unittest.TestCase):
         value = self.db.get_inventory_value()
         self.assertAlmostEqual(value, 19.99)
 
+    def test_get_inventory_stats(self):
+        """Inventory stats should count statuses and value In Stock items."""
+        self.db.add_inventory_item({'title': 'A', 'cost': 4.00, 'status': 'In Stock'})
+        self.db.add_inventory_item({'title': 'B', 'purchase_price': 6.00, 'status': 'in stock'})
+        self.db.add_inventory_item({'title': 'C', 'cost': 'n/a', 'status': 'In Stock'})
+        self.db.add_inventory_item({'title': 'D', 'cost': 9.00, 'status': 'Listed'})
+        self.db.add_inventory_item({'title': 'E', 'cost': 2.00, 'status': 'Sold'})
+
+        stats = self.db.get_inventory_stats()
+        self.assertEqual(stats['total'], 5)
+        self.assertEqual(stats['in_stock'], 3)
+        self.assertEqual(stats['listed'], 1)
+        self.assertEqual(stats['sold'], 1)
+        self.assertAlmostEqual(stats['in_stock_value'], 10.00)
+
+    def test_get_inventory_pricing_rows(self):
+        """Pricing rows should be tuples with the cost fallback applied."""
+        first = self.db.add_inventory_item({'title': 'A', 'cost': 4.00, 'status': 'In Stock',
+                                            'weight_lbs': 1.5, 'length_in': 10})
+        second = self.db.add_inventory_item({'title': 'B', 'purchase_price': 6.00,
+                                             'status': 'in stock'})
+        self.db.add_inventory_item({'title': 'C', 'cost': 9.00, 'status': 'Listed'})
+
+        rows = self.db.get_inventory_pricing_rows()
+        self.assertEqual(rows[0], (second, 'B', 6.00, None, None, None, None))
+        self.assertEqual(rows[1], (first, 'A', 4.00, 1.5, 10, None, None))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual([row[1] for row in self.db.get_inventory_pricing_rows('Listed')], ['C'])
+
+    def test_count_rows(self):
+        """count_* helpers should count rows without loading them."""
+        self.assertEqual(self.db.count_inventory_items(), 0)
+        self.assertEqual(self.db.count_expenses(), 0)
+        self.db.add_inventory_item({'title': 'A'})
+        self.db.add_inventory_item({'title': 'B'})
+        self.db.add_expense({'date': '2024-01-01', 'category': 'Supplies', 'amount': 3.5})
+        self.assertEqual(self.db.count_inventory_items(), 2)
+        self.assertEqual(self.db.count_expenses(), 1)
+
+    def test_iter_rows(self):
+        """iter_* helpers should yield the same rows as their get_* counterparts."""
+        self.db.add_inventory_item({'title': 'A', 'cost': 2.5})
+        self.db.add_inventory_item({'title': 'B'})
+        self.db.add_expense({'date': '2024-01-01', 'category': 'Supplies', 'amount': 3.5})
+
+        items = self.db.iter_inventory_items()
+        first = next(items)
+        # Other queries may run while the iterator is open.
+        self.assertEqual(self.db.count_inventory_items(), 2)
+        self.assertEqual([first] + list(items), self.db.get_inventory_items())
+        self.assertEqual(list(self.db.iter_expenses()), self.db.get_expenses())
+
+        columns, rows = self.db.get_expenses_raw()
+        self.assertEqual([dict(zip(columns, row)) for row in rows], self.db.get_expenses())
+
+    def test_get_settings_bulk(self):
+        """get_settings_bulk should return only the stored keys asked for."""
+        self.db.set_setting('ebay_fee_percent', '0.15')
+        self.db.set_setting('payment_fee_fixed', '0.49')
+        self.db.set_setting('unrelated', 'x')
+
+        settings = self.db.get_settings_bulk(['ebay_fee_percent', 'payment_fee_fixed', 'missing'])
+        self.assertEqual(settings, {'ebay_fee_percent': '0.15', 'payment_fee_fixed': '0.49'})
+        self.assertEqual(self.db.get_settings_bulk([]), {})
+
+    def test_revision_changes_on_writes(self):
+        """revision should move on writes and stay put on reads."""
+        start = self.db.revision
+        self.db.get_inventory_items()
+        self.assertEqual(self.db.revision, start)
+
+        item_id = self.db.add_inventory_item({'title': 'Rev Item'})
+        after_add = self.db.revision
+        self.assertNotEqual(after_add, start)
+
+        self.db.delete_inventory_item(item_id)
+        self.assertNotEqual(self.db.revision, after_add)
+
+    def test_open_reader_sees_committed_rows(self):
+        """open_reader should read the same file through a new connection."""
+        item_id = self.db.add_inventory_item({'title': 'Shared Item'})
+        reader = self.db.open_reader()
+        try:
+            self.assertIsNot(reader.conn, self.db.conn)
+            self.assertEqual(reader.get_inventory_item(item_id)['title'], 'Shared Item')
+        finally:
+            reader.close()
+
+        journal_mode = self.db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode.lower(), 'wal')
+
+        memory_db = Database(':memory:')
+        try:
+            self.assertIsNone(memory_db.open_reader())
+        finally:
+            memory_db.close()
+
     def test_mark_item_as_sold(self):
         """Test marking item as sold"""
         # Add test item
@@ -1,5 +1,5 @@
 """Tests for GUI value helper utilities."""
-from gui.value_helpers import resolve_cost, format_currency
+from gui.value_helpers import resolve_cost, format_currency, parse_float
 
 
 class FakeRow:
@@ -27,3 +27,11 @@ def test_format_currency_handles_invalid_values():
     assert format_currency("bad", default="-") == "-"
     assert format_currency(None) == "N/A"
     assert format_currency(5) == "$5.00"
+
+
+def test_parse_float_separates_blank_from_invalid():
+    assert parse_float("12.5") == 12.5
+    assert parse_float("", 0.0) == 0.0
+    assert parse_float("  ", 1.0) == 1.0
+    assert parse_float(None, 0.0) == 0.0
+    assert parse_float("abc", 0.0) is None